@@ -0,0 +1,51 @@
+from typing import Callable, Iterator, NamedTuple, Optional, Sequence
+
+from QICS_BG.analysis import EPSILON, move_probability
+
+MAX_DEPTH = 4
+
+
+class Suggestion(NamedTuple):
+    card_pos: int
+    qubit: int
+    # Probability of hitting an objective within depth turns when playing this move
+    probability: float
+    depth: int
+
+
+def best_move(hand: Sequence[str], state: Sequence[Optional[str]], objectives: Sequence[Sequence[str]], depth: int,
+              is_cancelled: Callable[[], bool] = lambda: False) -> Optional[Suggestion]:
+    """
+    Find the move giving the best chances to hit one of the objectives within depth turns.
+    :return: the best move, or None if the search has been cancelled
+    """
+    best = None
+    for card_pos in range(len(hand)):
+        for qubit in range(2):
+            if is_cancelled():
+                return None
+
+            probability = max(
+                move_probability(hand, state, objective, card_pos, qubit, depth) for objective in objectives
+            )
+            if best is None or probability > best.probability:
+                best = Suggestion(card_pos, qubit, probability, depth)
+    return best
+
+
+def iter_suggestions(snapshot, player: int, max_depth: int = MAX_DEPTH,
+                     is_cancelled: Callable[[], bool] = lambda: False) -> Iterator[Suggestion]:
+    """
+    Iterative deepening search on a GameSnapshot, yields the best move found so far after each depth.
+    Stops early when is_cancelled returns True or when an objective is certain to be hit.
+    """
+    hand = snapshot.get_hand(player)
+    objectives = snapshot.objectives[player - 1]
+
+    for depth in range(1, max_depth + 1):
+        suggestion = best_move(hand, snapshot.state, objectives, depth, is_cancelled)
+        if suggestion is None:
+            return
+        yield suggestion
+        if suggestion.probability >= 1.0 - EPSILON:
+            return
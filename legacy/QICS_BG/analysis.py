@@ -0,0 +1,166 @@
+"""
+Balance analysis of hands and objectives.
+
+Probabilities are computed from the point of view of a single player, the moves of the opponent are ignored.
+An objective is hit when the first pair of qubits matches it, as in Game.check_win.
+"""
+import random
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from QICS_BG.game import EMPTY_STATE, STATE_INDEX, STATES
+from QICS_BG.packed import (ENTANGLE, OPERATION_INDEX, OPERATIONS, OPERATIONS_WEIGHTS, ROTATION_TABLE, apply_move,
+                            pack_state, pair_index, split_state)
+
+_TOTAL_WEIGHT = sum(OPERATIONS_WEIGHTS)
+_DRAWS = [(operation, weight / _TOTAL_WEIGHT) for operation, weight in enumerate(OPERATIONS_WEIGHTS)]
+
+# Tolerance on probabilities summed over the card draws
+EPSILON = 1e-9
+
+# Number of probabilities kept, keyed on (packed pair, hand counts, objective, turns), the least recently used ones
+# are dropped so hints requested during a long session do not grow the table forever
+TABLE_SIZE = 1 << 18
+
+
+def hand_counts(hand: Sequence[str]) -> Tuple[int, ...]:
+    """Number of cards of each operation in a hand, the order of the cards does not matter."""
+    counts = [0] * len(OPERATIONS)
+    for card in hand:
+        counts[OPERATION_INDEX[card]] += 1
+    return tuple(counts)
+
+
+def objective_index(objective: Sequence[str]) -> int:
+    return pair_index(STATE_INDEX[objective[0]], STATE_INDEX[objective[1]])
+
+
+def _move_pair(pair: int, operation: int, qubit: int) -> int:
+    first, second = divmod(pair, len(STATES))
+    if qubit == 0:
+        return pair_index(ROTATION_TABLE[operation][first], second)
+    return pair_index(first, ROTATION_TABLE[operation][second])
+
+
+def _move_probability(pair: int, hand: Tuple[int, ...], operation: int, qubit: int, objective: int,
+                      turns: int) -> float:
+    """Probability of hitting the objective within turns when the first move is fixed."""
+    new_pair = _move_pair(pair, operation, qubit)
+    expected = 0.0
+    for drawn, probability in _DRAWS:
+        new_hand = list(hand)
+        new_hand[operation] -= 1
+        new_hand[drawn] += 1
+        expected += probability * _probability(new_pair, tuple(new_hand), objective, turns - 1)
+    return expected
+
+
+@lru_cache(maxsize=TABLE_SIZE)
+def _probability(pair: int, hand: Tuple[int, ...], objective: int, turns: int) -> float:
+    if pair == objective:
+        return 1.0
+    if turns == 0:
+        return 0.0
+
+    best = 0.0
+    for operation, count in enumerate(hand):
+        if not count:
+            continue
+
+        # The entangled pair never changes the first pair, so E only acts as a way to redraw a card
+        qubits = (0,) if operation == ENTANGLE else (0, 1)
+        for qubit in qubits:
+            best = max(best, _move_probability(pair, hand, operation, qubit, objective, turns))
+
+            if best >= 1.0 - EPSILON:
+                return 1.0
+
+    return best
+
+
+def win_probability(hand: Sequence[str], state: Sequence[Optional[str]], objective: Sequence[str],
+                    turns: int) -> float:
+    """
+    Exact probability of hitting an objective within a number of turns, when the player plays optimally.
+    Cards are refilled following OPERATIONS_WEIGHTS.
+    :param hand: hand of the player, as returned by Game.get_hand
+    :param state: the qubits as strings, only the first pair matters
+    :param objective: the objective, a pair of states
+    :param turns: number of turns played by the player
+    :return: the probability
+    """
+    pair = pair_index(STATE_INDEX[state[0]], STATE_INDEX[state[1]])
+    return _probability(pair, hand_counts(hand), objective_index(objective), turns)
+
+
+def move_probability(hand: Sequence[str], state: Sequence[Optional[str]], objective: Sequence[str], card_pos: int,
+                     qubit: int, turns: int) -> float:
+    """
+    Same as win_probability when the first card played is the one at card_pos, on the given qubit.
+    """
+    pair = pair_index(STATE_INDEX[state[0]], STATE_INDEX[state[1]])
+    if pair == objective_index(objective):
+        return 1.0
+    return _move_probability(pair, hand_counts(hand), OPERATION_INDEX[hand[card_pos]], qubit,
+                             objective_index(objective), turns)
+
+
+def win_probability_table(hand: Sequence[str], state: Sequence[Optional[str]], objectives: Sequence[Sequence[str]],
+                          max_turns: int) -> List[List[float]]:
+    """
+    Exact probabilities for every objective and every number of turns up to max_turns.
+    :return: table[i][k] is the probability of hitting objectives[i] within k turns
+    """
+    return [
+        [win_probability(hand, state, objective, turns) for turns in range(max_turns + 1)]
+        for objective in objectives
+    ]
+
+
+def sample_win_probability(hand: Sequence[str], state: Sequence[Optional[str]], objectives: Sequence[Sequence[str]],
+                           turns: int, nb_samples: int = 10000,
+                           rng: random.Random = None) -> Tuple[List[float], List[float]]:
+    """
+    Estimate the probabilities of hitting each objective within a number of turns when cards are played at random.
+    Unlike win_probability, the whole state is followed so the bonus point of the entangled pair is measured too.
+    :return: probability of hitting each objective, and probability of hitting it with the entangled pair as well
+    """
+    rng = rng if rng is not None else random.Random()
+    targets = [objective_index(objective) for objective in objectives]
+    start_hand = [OPERATION_INDEX[card] for card in hand]
+    start = pack_state(list(state))
+    operations = list(range(len(OPERATIONS)))
+
+    hits = [0] * len(targets)
+    doubles = [0] * len(targets)
+    for _ in range(nb_samples):
+        current_hand = list(start_hand)
+        packed = start
+        hit = [False] * len(targets)
+        double = [False] * len(targets)
+        for _ in range(turns):
+            position = rng.randrange(len(current_hand))
+            packed = apply_move(packed, current_hand[position], rng.randrange(2))
+            current_hand[position] = rng.choices(operations, weights=OPERATIONS_WEIGHTS)[0]
+
+            q0, q1, q2, q3 = split_state(packed)
+            first = pair_index(q0, q1)
+            second = pair_index(q2, q3) if q2 != EMPTY_STATE else -1
+            for i, target in enumerate(targets):
+                if first == target:
+                    hit[i] = True
+                    double[i] = double[i] or second in targets
+        for i in range(len(targets)):
+            hits[i] += hit[i]
+            doubles[i] += double[i]
+
+    return [hit / nb_samples for hit in hits], [double / nb_samples for double in doubles]
+
+
+def table_size() -> int:
+    """Number of entries in the precomputed table."""
+    return _probability.cache_info().currsize
+
+
+def clear_table():
+    _probability.cache_clear()
@@ -1,27 +1,34 @@
 WINDOW_HEIGHT = 720
 WINDOW_WIDTH = 1280
 
-BOARD_MARGIN = int(5 * WINDOW_WIDTH / 100)  # 5% margin
-BOARD_WIDTH = int(5*WINDOW_WIDTH / 6 - 2 * BOARD_MARGIN)
-BOARD_HEIGHT = int(50 * WINDOW_HEIGHT / 100)  # 50% height
-
 NB_SLOTS = 6
-SLOT_MARGIN = int(5 * BOARD_HEIGHT // 100)
-SLOT_WIDTH = int((BOARD_WIDTH - (NB_SLOTS + 1) * SLOT_MARGIN) / NB_SLOTS)
-SLOT_HEIGHT = int((BOARD_HEIGHT - 3 * SLOT_MARGIN) / 2)
 
-# Square the slots
-SLOT_WIDTH = min(SLOT_HEIGHT, SLOT_WIDTH)
-SLOT_HEIGHT = SLOT_WIDTH
+# Geometry of the window at its default size, in pixels, QICS_BG.layout scales it with the window
+TITLE_BAR_HEIGHT = int(5 * WINDOW_HEIGHT // 100)  # 5% height
+MARGIN = int(1.5 * WINDOW_HEIGHT // 100)  # 1.5% height, between the panels
+CARD_SIZE = 100
+CARD_PADDING = 20  # left and right, inside the cards
+OBJECTIVE_SIZE = 50
+RETURN_BUTTON_WIDTH = 40
 
-# Readapt board to slots
-BOARD_HEIGHT = SLOT_HEIGHT * 2 + SLOT_MARGIN * 3
+# Not scaled with the window, only with the density of the screen
+EXIT_BUTTON_SIZE = 20
+EXIT_BUTTON_MARGIN = 10
+MIN_CARD_SIZE = 24
+MIN_FONT_SIZE = 6
 
-TITLE_BAR_HEIGHT = int(5 * WINDOW_HEIGHT // 100)  # 5% height
+# Shares of the height between the hand panel and the board, and within the hand between cards and objectives
+UI_BUTTONS_STRETCH = 5
+BOARD_STRETCH = 6
+HAND_CARDS_STRETCH = 2
+HAND_OBJECTIVES_STRETCH = 1
+# Share of the width of the current state, the board gets one share per slot
+STATES_STRETCH = 2
 
-UI_BUTTONS_HEIGHT = int(35 * WINDOW_HEIGHT // 100)  # 10% height
-UI_BUTTONS_MARGIN = BOARD_MARGIN
-UI_BUTTONS_WIDTH = int(WINDOW_WIDTH - 2 * BOARD_MARGIN)
+# Height of the text relative to the square it is written in
+SLOT_FONT_RATIO = 0.2
+CARD_FONT_RATIO = 0.16
+OBJECTIVE_FONT_RATIO = 0.4
 
 NB_CARDS_HAND = 6
 NB_OBJECTIVES = 3
@@ -0,0 +1,144 @@
+"""
+Self-play datasets stored as chunked columns.
+
+A dataset is a directory holding one .npy file per column and per shard, named <shard>_<column>.npy, and a
+meta.json file listing the shards. Every shard can be memory mapped with numpy.load(..., mmap_mode="r").
+"""
+import json
+import os
+import random
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from QICS_BG.headless import HeadlessGame
+from QICS_BG.rules import DEFAULT_RULES
+
+COLUMNS = {
+    "game": (np.uint32, ()),
+    "state": (np.uint16, ()),  # packed state before the move
+    "player": (np.uint8, ()),
+    "hand": (np.uint8, (DEFAULT_RULES.hand_size,)),  # hand of the player before the move
+    "objectives": (np.uint8, (DEFAULT_RULES.nb_objectives,)),  # objectives of the player before the move
+    "card_pos": (np.uint8, ()),
+    "qubit": (np.uint8, ()),
+    "outcome": (np.uint8, ()),  # result of check_win after the move
+}
+
+CHUNK_SIZE = 1 << 20
+BATCH_SIZE = 1 << 12
+
+# A policy returns (card_pos, qubit) for a player of a game
+Policy = Callable[[HeadlessGame, int], Tuple[int, int]]
+
+
+def random_policy(game: HeadlessGame, player: int) -> Tuple[int, int]:
+    return game.rng.randrange(game.rules.hand_size), game.rng.randrange(2)
+
+
+class DatasetWriter:
+    """
+    Streams rows into fixed size column buffers and writes a shard each time they are full,
+    so memory does not grow with the size of the dataset.
+    """
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.buffers = {
+            name: np.empty((chunk_size, *shape), dtype=dtype) for name, (dtype, shape) in COLUMNS.items()
+        }
+        self.size = 0
+        self.shards: List[int] = []
+
+        os.makedirs(path, exist_ok=True)
+
+    def append(self, batch: Dict[str, np.ndarray]):
+        """Append a batch of rows, given as one array per column."""
+        length = len(batch["game"])
+        start = 0
+        while start < length:
+            count = min(length - start, self.chunk_size - self.size)
+            for name, buffer in self.buffers.items():
+                buffer[self.size:self.size + count] = batch[name][start:start + count]
+            self.size += count
+            start += count
+
+            if self.size == self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self.size:
+            return
+        shard = len(self.shards)
+        for name, buffer in self.buffers.items():
+            np.save(os.path.join(self.path, f"{shard:05d}_{name}.npy"), buffer[:self.size])
+        self.shards.append(self.size)
+        self.size = 0
+
+    def close(self):
+        self.flush()
+        with open(os.path.join(self.path, "meta.json"), "w") as file:
+            json.dump({"columns": list(COLUMNS), "shards": self.shards}, file)
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, *args):
+        # Without meta.json an interrupted export is not mistaken for a complete dataset by load_shards
+        if exc_type is None:
+            self.close()
+
+
+def load_shards(path: str, mmap_mode: str = "r") -> Iterator[Dict[str, np.ndarray]]:
+    """Iterate over the shards of a dataset, each one as a dictionary of memory mapped columns."""
+    with open(os.path.join(path, "meta.json")) as file:
+        meta = json.load(file)
+    for shard in range(len(meta["shards"])):
+        yield {
+            name: np.load(os.path.join(path, f"{shard:05d}_{name}.npy"), mmap_mode=mmap_mode)
+            for name in meta["columns"]
+        }
+
+
+def self_play(nb_games: int, moves_per_game: int, policy: Policy = random_policy, seed: int = None,
+              batch_size: int = BATCH_SIZE) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Play headless games, players alternating, and yield the moves by batches of columns.
+    """
+    rng = random.Random(seed)
+    rows = {name: [] for name in COLUMNS}
+
+    for game_id in range(nb_games):
+        game = HeadlessGame(random.Random(rng.getrandbits(64)))
+        for move in range(moves_per_game):
+            player = move % 2 + 1
+            card_pos, qubit = policy(game, player)
+
+            rows["game"].append(game_id)
+            rows["state"].append(game.state)
+            rows["player"].append(player)
+            rows["hand"].append(list(game.hands[player - 1]))
+            rows["objectives"].append(list(game.objectives[player - 1]))
+            rows["card_pos"].append(card_pos)
+            rows["qubit"].append(qubit)
+            rows["outcome"].append(game.play_turn(player, card_pos, qubit))
+
+            if len(rows["game"]) == batch_size:
+                yield _to_columns(rows)
+                rows = {name: [] for name in COLUMNS}
+
+    if rows["game"]:
+        yield _to_columns(rows)
+
+
+def _to_columns(rows: Dict[str, list]) -> Dict[str, np.ndarray]:
+    return {name: np.array(rows[name], dtype=dtype) for name, (dtype, _) in COLUMNS.items()}
+
+
+def export_self_play(path: str, nb_games: int, moves_per_game: int, policy: Policy = random_policy,
+                     seed: int = None, chunk_size: int = CHUNK_SIZE):
+    """Generate a self-play dataset in path."""
+    with DatasetWriter(path, chunk_size) as writer:
+        for batch in self_play(nb_games, moves_per_game, policy, seed):
+            writer.append(batch)
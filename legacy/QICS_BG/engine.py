@@ -0,0 +1,150 @@
+import logging
+import queue
+import threading
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from QICS_BG.constants import *
+from QICS_BG.game import Game
+from QICS_BG.packed import pack_game_state
+from QICS_BG.replay import Recording, Replay
+
+logger = logging.getLogger(__name__)
+
+
+class PlayCard(NamedTuple):
+    """Command playing the card at card_pos in the hand of player on a qubit."""
+    player: int
+    card_pos: int
+    qubit: int
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Immutable copy of the state of a Game, safe to share between threads.
+    The history of the moves is not copied: history is the append-only Game.board_content, shared by every snapshot
+    of the game, and only its first nb_moves moves belong to the snapshot.
+    """
+    turn: int
+    hands: Tuple[Tuple[str, ...], ...]
+    objectives: Tuple[Tuple[Tuple[str, str], ...], ...]
+    state: Tuple[str, ...]
+    entangled: bool
+    scores: Tuple[int, int]
+    history: Sequence[Tuple[str, int]]
+    nb_moves: int
+    winner: int = 0
+
+    def get_hand(self, player: int) -> Tuple[str, ...]:
+        return self.hands[player - 1]
+
+    @property
+    def last_move(self) -> Optional[Tuple[str, int]]:
+        return self.history[self.nb_moves - 1] if self.nb_moves else None
+
+
+def take_snapshot(game: Game, winner: int = 0) -> GameSnapshot:
+    return GameSnapshot(
+        turn=game.turn,
+        hands=tuple(tuple(hand) for hand in game.hands),
+        objectives=tuple(tuple(tuple(objective) for objective in objectives) for objectives in game.objectives),
+        state=tuple(str(state) for state in game.state),
+        entangled=game.entangled,
+        scores=tuple(game.scores),
+        history=game.board_content,
+        nb_moves=len(game.board_content),
+        winner=winner,
+    )
+
+
+class GameEngine:
+    """
+    Single writer of a Game.
+    Commands are queued from any thread and executed in order by a worker thread, after each command a new
+    snapshot is published to the subscribers. Subscribers are called from the worker thread.
+    Errors of a command or of a subscriber are logged and do not stop the worker.
+    """
+
+    _STOP = object()
+
+    def __init__(self, game: Game = None):
+        self.game = game if game is not None else Game()
+
+        self._commands = queue.Queue()
+        self._subscribers: List[Callable[[GameSnapshot], None]] = []
+        self._lock = threading.Lock()
+        self._snapshot = take_snapshot(self.game)
+        self._recording = Recording(pack_game_state(self.game), self.game.scores)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> GameSnapshot:
+        """Last published snapshot."""
+        with self._lock:
+            return self._snapshot
+
+    def replay(self) -> Replay:
+        """Replay of the moves played so far."""
+        with self._lock:
+            recording = self._recording.copy()
+        return Replay(recording)
+
+    def subscribe(self, callback: Callable[[GameSnapshot], None]):
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[GameSnapshot], None]):
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def submit(self, command: PlayCard):
+        if command.player not in [1, 2] or not 0 <= command.card_pos < NB_CARDS_HAND or command.qubit not in [0, 1]:
+            raise ValueError(f"Invalid command {command}")
+        self._commands.put(command)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="GameEngine", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker once the already submitted commands are processed."""
+        if self._thread is None:
+            return
+        self._commands.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def join(self):
+        """Wait until every submitted command has been processed."""
+        self._commands.join()
+
+    def _run(self):
+        while True:
+            command = self._commands.get()
+            try:
+                if command is self._STOP:
+                    return
+                self._execute(command)
+            except Exception:
+                logger.exception("Command %s failed", command)
+            finally:
+                self._commands.task_done()
+
+    def _execute(self, command: PlayCard):
+        scores = sum(self.game.scores)
+        self.game.play_turn(command.player, command.card_pos, command.qubit, lambda: None)
+        winner = self.game.check_win()
+        snapshot = take_snapshot(self.game, winner)
+        card, qubit = self.game.board_content[-1]
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._recording.record(card, qubit, winner, sum(self.game.scores) - scores)
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception:
+                logger.exception("Subscriber %r failed", callback)
@@ -1,6 +1,7 @@
 import random
 from typing import Callable, List
 
+from QICS_BG import metrics
 from QICS_BG.constants import *
 from QICS_BG.utils import *
 
@@ -33,34 +34,61 @@ STATE_TO_AXIS = {
 }
 
 
+def rotate_state(state: str, rotation: str) -> str:
+    """
+    Rules of the rotations on the state of a qubit.
+    """
+    # If it is in the basis nothing happens
+    if state in BASIS[rotation]:
+        return state
+
+    # If it isn't we apply the rotation
+    if rotation in ["X", "Y", "Z"]:
+        return OPPOSITE_STATE[state]
+
+    # Otherwise we do a half rotation
+    curr_axis = STATE_TO_AXIS[state]
+    rotation_axis = rotation if len(rotation) == 1 else rotation[1]
+
+    for axis in ["X", "Y", "Z"]:
+        if axis not in [curr_axis, rotation_axis]:
+            return BASIS[axis][BASIS[curr_axis].index(state)]
+
+
+# States are stored as their index in STATES, EMPTY_STATE for an empty qubit
+EMPTY_STATE = len(STATES)
+STATE_INDEX = {state: i for i, state in enumerate(STATES)}
+ROTATIONS = {
+    rotation: [STATE_INDEX[rotate_state(state, rotation)] for state in STATES] + [EMPTY_STATE]
+    for rotation in BASIS
+}
+
+
 class State:
     """
     Class implementing the state of a qubit.
     """
+    __slots__ = ("index",)
 
     def __init__(self, init_state=None):
-        self.state = init_state
+        self.index = EMPTY_STATE if init_state is None else STATE_INDEX[init_state]
 
-    def rotate(self, rotation):
-        if self.is_empty():
-            return
+    @property
+    def state(self):
+        return None if self.index == EMPTY_STATE else STATES[self.index]
 
-        # If it is in the basis nothing happens
-        if self.state in BASIS[rotation]:
-            return
+    @state.setter
+    def state(self, new_state):
+        self.index = EMPTY_STATE if new_state is None else STATE_INDEX[new_state]
 
-        # If it isn't we apply the rotation
-        if rotation in ["X", "Y", "Z"]:
-            self.state = OPPOSITE_STATE[self.state]
+    def rotate(self, rotation):
+        if self.index == EMPTY_STATE:
             return
 
-        # Otherwise we do a half rotation
-        curr_axis = STATE_TO_AXIS[self.state]
-        rotation_axis = rotation if len(rotation) == 1 else rotation[1]
+        if metrics.ENABLED:
+            metrics.count("rotations")
 
-        for axis in ["X", "Y", "Z"]:
-            if axis not in [curr_axis, rotation_axis]:
-                self.state = BASIS[axis][BASIS[curr_axis].index(self.state)]
+        self.index = ROTATIONS[rotation][self.index]
 
     def set_state(self, new_state):
         if new_state == "/":
@@ -72,7 +100,7 @@ class State:
         return OPPOSITE_STATE[self.state]
 
     def is_empty(self):
-        return self.state is None
+        return self.index == EMPTY_STATE
 
     def axis(self):
         return STATE_TO_AXIS[self.state]
@@ -125,6 +153,9 @@ class Game(metaclass=Singleton):
         self.hands[player - 1][pos] = random.choices(OPERATIONS, k=1, weights=OPERATIONS_WEIGHTS)[0]
 
     def entangle(self):
+        if metrics.ENABLED:
+            metrics.count("entangle_toggles")
+
         if not self.entangled:
             self.state[2].set_state(self.state[0].oppposite())
             self.state[3].set_state(self.state[1].oppposite())
@@ -142,6 +173,7 @@ class Game(metaclass=Singleton):
         self.state[qubit].rotate(rotation)
         self.state[qubit + 2].rotate(rotation)
 
+    @metrics.timed("play_turn")
     def play_turn(self, player: int, card_pos: int, qubit: int, callback: Callable):
         # Get the player's hand and card
         card = self.get_hand(player)[card_pos]
@@ -158,6 +190,7 @@ class Game(metaclass=Singleton):
 
         callback()
 
+    @metrics.timed("check_win")
     def check_win(self) -> int:
         """
         Check if the game is won
@@ -171,8 +204,12 @@ class Game(metaclass=Singleton):
             if state_str_2 in self.objectives[0]:
                 self.scores[0] += 1
                 self.objectives[0][self.objectives[0].index(state_str_2)] = random.choices(STATES[1:], k=2)
+                if metrics.ENABLED:
+                    metrics.count("objective_redraws")
 
             self.objectives[0][self.objectives[0].index(state_str_1)] = random.choices(STATES[1:], k=2)
+            if metrics.ENABLED:
+                metrics.count("objective_redraws")
 
             # If there is a win, we disentangle the qubits
             if self.entangled:
@@ -184,8 +221,12 @@ class Game(metaclass=Singleton):
             if state_str_2 in self.objectives[1]:
                 self.scores[1] += 1
                 self.objectives[1][self.objectives[1].index(state_str_2)] = random.choices(STATES[1:], k=2)
+                if metrics.ENABLED:
+                    metrics.count("objective_redraws")
 
             self.objectives[1][self.objectives[1].index(state_str_1)] = random.choices(STATES[1:], k=2)
+            if metrics.ENABLED:
+                metrics.count("objective_redraws")
 
             # If there is a win, we disentangle the qubits
             if self.entangled:
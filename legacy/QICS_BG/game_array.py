@@ -0,0 +1,63 @@
+"""
+Arrays of games stored as records of DEFAULT_RULES (28 bytes per game with the classic rules), to keep millions of
+games in memory.
+"""
+import random
+
+import numpy as np
+
+from QICS_BG.headless import HeadlessGame
+from QICS_BG.rules import DEFAULT_RULES
+
+# Same layout as DEFAULT_RULES.record
+GAME_DTYPE = np.dtype([
+    ("state", "<u2"),
+    ("turn", "<u4"),
+    ("scores", "<u2", (2,)),
+    ("hands", "u1", (2, DEFAULT_RULES.hand_size)),
+    ("objectives", "u1", (2, DEFAULT_RULES.nb_objectives)),
+])
+assert GAME_DTYPE.itemsize == DEFAULT_RULES.record.size
+
+
+class GameArray:
+    """
+    Fixed size array of games. Games are unpacked into a HeadlessGame only while they are played.
+    """
+
+    def __init__(self, size: int = 0, buffer=None) -> None:
+        """
+        :param size: number of games
+        :param buffer: optional buffer holding the games, e.g. shared memory, a new one is allocated if None
+        """
+        if buffer is None:
+            self.records = np.zeros(size, dtype=GAME_DTYPE)
+        else:
+            self.records = np.ndarray(size, dtype=GAME_DTYPE, buffer=buffer)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def nbytes(self) -> int:
+        return self.records.nbytes
+
+    def reset(self, start: int = 0, stop: int = None, rng: random.Random = None):
+        """Deal new games in [start, stop)."""
+        rng = rng if rng is not None else random.Random()
+        stop = len(self) if stop is None else stop
+        for i in range(start, stop):
+            self.store(i, HeadlessGame(rng))
+
+    def dealt(self) -> np.ndarray:
+        """
+        Mask of the games dealt by reset or stored, the records of a new array are zeros which is not a valid game:
+        the pair ("0", "0") is never an objective.
+        """
+        return (self.records["objectives"] != 0).all(axis=(1, 2))
+
+    def load(self, i: int, rng: random.Random = None) -> HeadlessGame:
+        return HeadlessGame.from_bytes(self.records[i:i + 1].tobytes(), rng)
+
+    def store(self, i: int, game: HeadlessGame):
+        self.records[i:i + 1] = np.frombuffer(game.to_bytes(), dtype=GAME_DTYPE)
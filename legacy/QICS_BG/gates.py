@@ -0,0 +1,97 @@
+"""
+Algebra of the single qubit cards.
+
+The cards X, Y, Z, SX, SY and SZ permute the six STATES, so any sequence of cards is equal to one element of the
+group they generate. Elements are numbered, the identity being 0, and their products are precomputed so a sequence
+of any length is reduced with one table lookup per card. The entangle card E is not a permutation of a single
+qubit and is not part of the algebra.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from QICS_BG.game import STATE_INDEX, STATES
+from QICS_BG.packed import ENTANGLE, OPERATION_INDEX, OPERATIONS, ROTATION_TABLE
+
+CARDS = [operation for i, operation in enumerate(OPERATIONS) if i != ENTANGLE]
+
+IDENTITY = 0
+
+
+def _generate() -> Tuple[List[Tuple[int, ...]], List[Tuple[str, ...]]]:
+    """
+    Enumerate the elements generated by the cards, breadth first so each element comes with one of its shortest
+    card sequences.
+    """
+    identity = tuple(range(len(STATES)))
+    elements = [identity]
+    words = [()]
+    index = {identity: 0}
+
+    i = 0
+    while i < len(elements):
+        for card in CARDS:
+            row = ROTATION_TABLE[OPERATION_INDEX[card]]
+            product = tuple(row[image] for image in elements[i])
+            if product not in index:
+                index[product] = len(elements)
+                elements.append(product)
+                words.append(words[i] + (card,))
+        i += 1
+    return elements, words
+
+
+# Each element is the permutation it applies: ELEMENTS[e][state] is the image of state
+ELEMENTS, SHORTEST_SEQUENCES = _generate()
+_ELEMENT_INDEX = {element: i for i, element in enumerate(ELEMENTS)}
+
+CARD_ELEMENT: Dict[str, int] = {
+    card: _ELEMENT_INDEX[tuple(ROTATION_TABLE[OPERATION_INDEX[card]][:len(STATES)])] for card in CARDS
+}
+
+# MULTIPLICATION[a][b] is the element applying a then b
+MULTIPLICATION = [
+    [_ELEMENT_INDEX[tuple(second[image] for image in first)] for second in ELEMENTS]
+    for first in ELEMENTS
+]
+
+INVERSE = [row.index(IDENTITY) for row in MULTIPLICATION]
+
+# ELEMENTS_MAPPING[a][b] lists the elements sending the state a to the state b
+ELEMENTS_MAPPING = [
+    [[e for e, element in enumerate(ELEMENTS) if element[a] == b] for b in range(len(STATES))]
+    for a in range(len(STATES))
+]
+
+CARDS_MAPPING = [
+    [[card for card in CARDS if ELEMENTS[CARD_ELEMENT[card]][a] == b] for b in range(len(STATES))]
+    for a in range(len(STATES))
+]
+
+
+def reduce(cards: Sequence[str]) -> int:
+    """Element equal to playing the cards in order on the same qubit."""
+    element = IDENTITY
+    for card in cards:
+        element = MULTIPLICATION[element][CARD_ELEMENT[card]]
+    return element
+
+
+def apply(element: int, state: Optional[str]) -> Optional[str]:
+    """Image of a state by an element, an empty qubit stays empty."""
+    if not state:
+        return state
+    return STATES[ELEMENTS[element][STATE_INDEX[state]]]
+
+
+def cards_mapping(a: str, b: str) -> List[str]:
+    """Cards sending the state a to the state b in one move."""
+    return CARDS_MAPPING[STATE_INDEX[a]][STATE_INDEX[b]]
+
+
+def elements_mapping(a: str, b: str) -> List[int]:
+    """Elements, i.e. classes of card sequences, sending the state a to the state b."""
+    return ELEMENTS_MAPPING[STATE_INDEX[a]][STATE_INDEX[b]]
+
+
+def shortest_sequence(a: str, b: str) -> Tuple[str, ...]:
+    """One of the shortest card sequences sending the state a to the state b."""
+    return min((SHORTEST_SEQUENCES[e] for e in elements_mapping(a, b)), key=len)
@@ -0,0 +1,91 @@
+import random
+from typing import List
+
+from QICS_BG import metrics
+from QICS_BG.game import EMPTY_STATE, STATES
+from QICS_BG.packed import apply_move, disentangle, pack_record, pack_state, pair_index, split_state, unpack_record
+from QICS_BG.rules import DEFAULT_RULES, Rules
+
+
+class HeadlessGame:
+    """
+    Same rules as Game on packed integers, without UI and without being a singleton so many games can be run.
+    Cards are indices in the operations of the rules and objectives are pair indices (see QICS_BG.packed.pair_index).
+    """
+    __slots__ = ("state", "hands", "objectives", "scores", "turn", "rng", "rules", "operations")
+
+    def __init__(self, rng: random.Random = None, rules: Rules = DEFAULT_RULES) -> None:
+        self.rng = rng if rng is not None else random.Random()
+        self.rules = rules
+        self.operations = range(len(rules.operations))
+        self.state = pack_state(["0", "0", None, None])
+        self.turn = 0
+        self.scores = [0, 0]
+        self.hands = [self.draw_cards(rules.hand_size), self.draw_cards(rules.hand_size)]
+        self.objectives = [
+            [self.draw_objective() for _ in range(rules.nb_objectives)],
+            [self.draw_objective() for _ in range(rules.nb_objectives)],
+        ]
+
+    @classmethod
+    def from_bytes(cls, data: bytes, rng: random.Random = None, rules: Rules = DEFAULT_RULES) -> "HeadlessGame":
+        """Game stored in the record of the rules, see QICS_BG.packed."""
+        game = cls.__new__(cls)
+        game.rng = rng if rng is not None else random.Random()
+        game.rules = rules
+        game.operations = range(len(rules.operations))
+        game.state, game.turn, game.scores, game.hands, game.objectives = unpack_record(data, rules)
+        return game
+
+    def to_bytes(self) -> bytes:
+        return pack_record(self.state, self.turn, self.scores, self.hands, self.objectives, self.rules)
+
+    def draw_cards(self, k: int) -> List[int]:
+        return self.rng.choices(self.operations, cum_weights=self.rules.cum_weights, k=k)
+
+    def draw_objective(self) -> int:
+        # The state "0" is not allowed in objectives
+        return pair_index(self.rng.randrange(1, len(STATES)), self.rng.randrange(1, len(STATES)))
+
+    @metrics.timed("headless.play_turn")
+    def play_turn(self, player: int, card_pos: int, qubit: int) -> int:
+        """
+        Play a card then check for a win, as the UI does after Game.play_turn.
+        :return: result of check_win
+        """
+        hand = self.hands[player - 1]
+        if metrics.ENABLED:
+            entangle = hand[card_pos] == self.rules.entangle
+            metrics.count("headless.entangle_toggles" if entangle else "headless.rotations")
+        self.state = apply_move(self.state, hand[card_pos], qubit, self.rules)
+        self.turn += 1
+        hand[card_pos] = self.rng.choices(self.operations, cum_weights=self.rules.cum_weights)[0]
+        return self.check_win()
+
+    @metrics.timed("headless.check_win")
+    def check_win(self) -> int:
+        """Same as Game.check_win"""
+        q0, q1, q2, q3 = split_state(self.state)
+        first = pair_index(q0, q1)
+        second = pair_index(q2, q3) if q2 != EMPTY_STATE else -1
+
+        for player in range(2):
+            objectives = self.objectives[player]
+            if first not in objectives:
+                continue
+
+            self.scores[player] += 1
+            if second in objectives:
+                self.scores[player] += 1
+                objectives[objectives.index(second)] = self.draw_objective()
+                if metrics.ENABLED:
+                    metrics.count("headless.objective_redraws")
+            objectives[objectives.index(first)] = self.draw_objective()
+            if metrics.ENABLED:
+                metrics.count("headless.objective_redraws")
+
+            # If there is a win, we disentangle the qubits
+            if q2 != EMPTY_STATE:
+                self.state = disentangle(self.state)
+            return player + 1
+        return 0
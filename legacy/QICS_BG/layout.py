@@ -0,0 +1,98 @@
+"""
+Geometry of the main window for any window size and screen density.
+
+Every rectangle and font size of the window is computed in one call from the size of the window and the logical
+DPI of its screen, so a resize only moves the widgets instead of rebuilding them. Results are cached, resizing
+back and forth between the same sizes costs one dictionary lookup.
+Rectangles are (x, y, width, height) in logical pixels, font sizes are in points.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from QICS_BG.constants import *
+
+Rect = Tuple[int, int, int, int]
+
+BASE_DPI = 96.0
+LAYOUT_CACHE_SIZE = 64
+
+
+class Layout(NamedTuple):
+    # In the coordinates of the central widget
+    title_bar: Rect
+    exit_button: Rect
+    content: Rect
+    # In the coordinates of the content widget
+    buttons: Rect
+    board: Rect
+    states: Rect
+    column_width: int
+    card_size: int
+    card_padding: int
+    objective_size: int
+    # Font sizes
+    slot_font: int
+    qubit_font: int
+    card_font: int
+    objective_font: int
+
+
+def _points(pixels: float, dpi: float) -> int:
+    """Font size in points whose text is about pixels high on a screen of the given DPI."""
+    return max(MIN_FONT_SIZE, int(pixels * 72 / dpi))
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def compute_layout(width: int, height: int, dpi: float = BASE_DPI) -> Layout:
+    """
+    Layout of the main window, the sizes of QICS_BG.constants are scaled from the default window to this one.
+    :param width: width of the window
+    :param height: height of the window
+    :param dpi: logical DPI of the screen showing the window
+    """
+    density = dpi / BASE_DPI
+    scale = min(width / WINDOW_WIDTH, height / WINDOW_HEIGHT)
+
+    exit_size = round(EXIT_BUTTON_SIZE * density)
+    title_height = max(TITLE_BAR_HEIGHT * height // WINDOW_HEIGHT, exit_size)
+    margin = max(1, round(MARGIN * scale))
+
+    content_width, content_height = width, max(0, height - title_height)
+    inner_height = max(0, content_height - 3 * margin)
+    buttons_height = inner_height * UI_BUTTONS_STRETCH // (UI_BUTTONS_STRETCH + BOARD_STRETCH)
+    board_height = inner_height - buttons_height
+    board_top = 2 * margin + buttons_height
+
+    inner_width = max(0, content_width - 3 * margin)
+    board_width = inner_width * NB_SLOTS // (NB_SLOTS + STATES_STRETCH)
+    states_width = inner_width - board_width
+
+    column_width = max(1, board_width // NB_SLOTS)
+    slot_size = min(column_width, board_height // 2)
+    qubit_size = min(states_width // 2, board_height // 2)
+
+    # Square cards, in a row next to the return button, within the share of the hand given to the cards
+    cards_height = buttons_height * HAND_CARDS_STRETCH // (HAND_CARDS_STRETCH + HAND_OBJECTIVES_STRETCH)
+    cards_width = (content_width - 2 * margin - RETURN_BUTTON_WIDTH) // NB_CARDS_HAND
+    card_size = max(MIN_CARD_SIZE, min(cards_height - 2 * margin, cards_width - margin, round(CARD_SIZE * scale)))
+    # The two cards of an objective are stacked in the rest of the hand
+    objectives_height = buttons_height - cards_height
+    objective_size = max(MIN_CARD_SIZE, min(objectives_height // 2 - margin, round(OBJECTIVE_SIZE * scale)))
+
+    return Layout(
+        title_bar=(0, 0, width, title_height),
+        exit_button=(width - exit_size - round(EXIT_BUTTON_MARGIN * density), (title_height - exit_size) // 2,
+                     exit_size, exit_size),
+        content=(0, title_height, content_width, content_height),
+        buttons=(margin, margin, max(0, content_width - 2 * margin), buttons_height),
+        board=(margin, board_top, board_width, board_height),
+        states=(2 * margin + board_width, board_top, states_width, board_height),
+        column_width=column_width,
+        card_size=card_size,
+        card_padding=CARD_PADDING * card_size // CARD_SIZE,
+        objective_size=objective_size,
+        slot_font=_points(slot_size * SLOT_FONT_RATIO, dpi),
+        qubit_font=_points(qubit_size * SLOT_FONT_RATIO, dpi),
+        card_font=_points(card_size * CARD_FONT_RATIO, dpi),
+        objective_font=_points(objective_size * OBJECTIVE_FONT_RATIO, dpi),
+    )
@@ -0,0 +1,118 @@
+"""
+Opt-in counters and timers for the game engine.
+
+Instrumentation is disabled by default and costs one flag check per call site. It is enabled with enable() or by
+setting the environment variable QICS_METRICS=1, in which case QICS_METRICS_DUMP can name a JSON file written
+at exit.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict
+
+ENABLED = os.environ.get("QICS_METRICS") == "1"
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+# name -> [number of calls, total time in seconds]
+_timers: Dict[str, list] = {}
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def count(name: str, value: int = 1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def _add_time(name: str, elapsed: float):
+    with _lock:
+        timer_ = _timers.setdefault(name, [0, 0.0])
+        timer_[0] += 1
+        timer_[1] += elapsed
+
+
+class timer:
+    """
+    Context manager timing a block:
+
+        with metrics.timer("search"):
+            ...
+    """
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = None
+
+    def __enter__(self) -> "timer":
+        if ENABLED:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        if self.start is not None:
+            _add_time(self.name, time.perf_counter() - self.start)
+
+
+def timed(name: str) -> Callable:
+    """Decorator timing every call of a function."""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _add_time(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def snapshot() -> dict:
+    """Current values, timers give their number of calls, total and mean time in seconds."""
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {
+                name: {"calls": calls, "total": total, "mean": total / calls if calls else 0.0}
+                for name, (calls, total) in _timers.items()
+            },
+        }
+
+
+def dump(path: str = None) -> str:
+    """Dump the metrics as JSON, to a file if a path is given."""
+    content = json.dumps(snapshot(), indent=2, sort_keys=True)
+    if path is not None:
+        with open(path, "w") as file:
+            file.write(content)
+    return content
+
+
+if ENABLED and os.environ.get("QICS_METRICS_DUMP"):
+    atexit.register(dump, os.environ["QICS_METRICS_DUMP"])
@@ -0,0 +1,147 @@
+from typing import List, Optional, Sequence, Tuple
+
+from QICS_BG.game import EMPTY_STATE, OPPOSITE_STATE, STATE_INDEX, STATES
+from QICS_BG.rules import CLASSIC_RULES, Rules
+
+NB_VALUES = EMPTY_STATE + 1
+
+# Tables of the classic rules, the ones of Game
+OPERATIONS = CLASSIC_RULES.operations
+OPERATIONS_WEIGHTS = CLASSIC_RULES.weights
+OPERATION_INDEX = CLASSIC_RULES.operation_index
+ENTANGLE = CLASSIC_RULES.entangle
+ROTATION_TABLE = CLASSIC_RULES.rotation_table
+OPPOSITE_TABLE = [STATE_INDEX[OPPOSITE_STATE[state]] for state in STATES] + [EMPTY_STATE]
+
+
+def pack_state(states: List[Optional[str]]) -> int:
+    """
+    Pack the four qubits of a game into a single integer.
+    :param states: list of 4 state strings, None or "" for an empty qubit
+    :return: the packed state
+    """
+    packed = 0
+    for state in reversed(states):
+        packed = packed * NB_VALUES + (STATE_INDEX[state] if state else EMPTY_STATE)
+    return packed
+
+
+def unpack_state(packed: int) -> List[Optional[str]]:
+    """
+    Inverse of pack_state.
+    :return: list of 4 state strings, None for an empty qubit
+    """
+    states = []
+    for _ in range(4):
+        packed, index = divmod(packed, NB_VALUES)
+        states.append(STATES[index] if index != EMPTY_STATE else None)
+    return states
+
+
+def split_state(packed: int) -> Tuple[int, int, int, int]:
+    """Return the indices of the four qubits of a packed state."""
+    packed, q0 = divmod(packed, NB_VALUES)
+    packed, q1 = divmod(packed, NB_VALUES)
+    q3, q2 = divmod(packed, NB_VALUES)
+    return q0, q1, q2, q3
+
+
+def join_state(q0: int, q1: int, q2: int, q3: int) -> int:
+    """Inverse of split_state."""
+    return ((q3 * NB_VALUES + q2) * NB_VALUES + q1) * NB_VALUES + q0
+
+
+def is_entangled(packed: int) -> bool:
+    return split_state(packed)[2] != EMPTY_STATE
+
+
+def apply_move(packed: int, operation: int, qubit: int, rules: Rules = CLASSIC_RULES) -> int:
+    """
+    Equivalent of Game.apply_rotation on a packed state.
+    :param packed: the packed state
+    :param operation: index of the operation in the rules
+    :param qubit: 0 or 1
+    :param rules: the rules giving the transitions
+    :return: the new packed state
+    """
+    q0, q1, q2, q3 = split_state(packed)
+
+    if operation == rules.entangle:
+        if q2 == EMPTY_STATE:
+            return join_state(q0, q1, OPPOSITE_TABLE[q0], OPPOSITE_TABLE[q1])
+        return join_state(q0, q1, EMPTY_STATE, EMPTY_STATE)
+
+    row = rules.rotation_table[operation]
+    if qubit == 0:
+        return join_state(row[q0], q1, row[q2], q3)
+    return join_state(q0, row[q1], q2, row[q3])
+
+
+def disentangle(packed: int) -> int:
+    """Empty the entangled pair, as done by Game.check_win after a point is scored."""
+    return packed % (NB_VALUES * NB_VALUES) + EMPTY_STATE * NB_VALUES * NB_VALUES * (NB_VALUES + 1)
+
+
+def pair_index(first: int, second: int) -> int:
+    """Index of a pair of qubit states, used for objectives."""
+    return first * len(STATES) + second
+
+
+def pack_game_state(game) -> int:
+    """Packed state of a Game instance."""
+    return pack_state([state.state for state in game.state])
+
+
+# Whole Game on 28 bytes
+GAME_RECORD = CLASSIC_RULES.record
+
+GameFields = Tuple[int, int, List[int], List[List[int]], List[List[int]]]
+
+
+def pack_record(state: int, turn: int, scores: Sequence[int], hands: Sequence[Sequence[int]],
+                objectives: Sequence[Sequence[int]], rules: Rules = CLASSIC_RULES) -> bytes:
+    """
+    Pack a game in the record of the rules, GAME_RECORD by default.
+    :param hands: cards as indices in the operations of the rules
+    :param objectives: objectives as pair indices
+    """
+    return rules.record.pack(state, turn, *scores, *hands[0], *hands[1], *objectives[0], *objectives[1])
+
+
+def unpack_record(data: bytes, rules: Rules = CLASSIC_RULES) -> GameFields:
+    """Inverse of pack_record, returns (state, turn, scores, hands, objectives)."""
+    fields = rules.record.unpack(data)
+    hand_size, nb_objectives = rules.hand_size, rules.nb_objectives
+    cards = 4 + 2 * hand_size
+    return (
+        fields[0],
+        fields[1],
+        list(fields[2:4]),
+        [list(fields[4:4 + hand_size]), list(fields[4 + hand_size:cards])],
+        [list(fields[cards:cards + nb_objectives]), list(fields[cards + nb_objectives:])],
+    )
+
+
+def pack_game(game) -> bytes:
+    """Pack a Game in a GAME_RECORD, the board history is not kept."""
+    return pack_record(
+        pack_game_state(game),
+        game.turn,
+        game.scores,
+        [[OPERATION_INDEX[card] for card in hand] for hand in game.hands],
+        [[pair_index(STATE_INDEX[objective[0]], STATE_INDEX[objective[1]]) for objective in objectives]
+         for objectives in game.objectives],
+    )
+
+
+def load_game(game, data: bytes):
+    """Restore a Game from a GAME_RECORD."""
+    state, game.turn, game.scores, hands, objectives = unpack_record(data)
+    for qubit, value in zip(game.state, unpack_state(state)):
+        qubit.state = value
+    game.entangled = not game.state[2].is_empty()
+    game.hands = [[OPERATIONS[card] for card in hand] for hand in hands]
+    game.objectives = [
+        [[STATES[pair // len(STATES)], STATES[pair % len(STATES)]] for pair in player_objectives]
+        for player_objectives in objectives
+    ]
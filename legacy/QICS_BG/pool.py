@@ -0,0 +1,114 @@
+"""
+Games kept in shared memory and played by several processes.
+
+The games of a SharedGamePool are a GameArray whose buffer is a multiprocessing.shared_memory block, every worker
+attaches the block by its name, claims chunks of games from a shared counter and plays them in place. Nothing but
+the name of the block and a few integers is sent to the workers, and the coordinator reads the results as numpy
+views of the same memory.
+"""
+import multiprocessing as mp
+import os
+import random
+from multiprocessing import shared_memory
+from typing import Tuple
+
+from QICS_BG.dataset import Policy, random_policy
+from QICS_BG.game_array import GAME_DTYPE, GameArray
+from QICS_BG.headless import HeadlessGame
+
+CHUNK_SIZE = 1024
+
+
+class SharedGamePool:
+    def __init__(self, size: int, name: str = None) -> None:
+        """
+        :param size: number of games
+        :param name: name of an existing block to attach, a new block is created if None
+        """
+        self.size = size
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=max(1, size * GAME_DTYPE.itemsize))
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.games = GameArray(size, buffer=self.memory.buf)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def close(self):
+        """Detach the block, it is also freed if this pool created it."""
+        if self.games is None:
+            return
+        # The numpy views must be released before the memory can be closed
+        self.games = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self) -> "SharedGamePool":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def run(self, moves_per_game: int, nb_workers: int = None, policy: Policy = random_policy, seed: int = None,
+            deal: bool = True, chunk_size: int = CHUNK_SIZE):
+        """
+        Play moves_per_game moves in every game, players alternating, and wait for the workers.
+        :param nb_workers: number of processes, one per core if None
+        :param policy: a policy as in QICS_BG.dataset, it must be picklable to reach the workers
+        :param seed: games are reproducible whatever the number of workers if given
+        :param deal: deal new games before playing them, False to go on with the games of a previous run
+        """
+        if not deal and not self.games.dealt().all():
+            raise ValueError("The pool holds games which were never dealt, run it with deal=True first")
+
+        nb_workers = nb_workers or os.cpu_count() or 1
+        nb_workers = max(1, min(nb_workers, -(-self.size // chunk_size)))
+        seed = seed if seed is not None else random.getrandbits(32)
+
+        counter = mp.Value("q", 0)
+        workers = [
+            mp.Process(target=_work, args=(self.name, self.size, counter, chunk_size, moves_per_game, policy, seed,
+                                           deal))
+            for _ in range(nb_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        failed = [worker.exitcode for worker in workers if worker.exitcode]
+        if failed:
+            raise RuntimeError(f"{len(failed)} simulation workers failed, exit codes {failed}")
+
+
+def _claim(counter, chunk_size: int, size: int) -> Tuple[int, int]:
+    with counter.get_lock():
+        start = counter.value
+        stop = min(size, start + chunk_size)
+        counter.value = stop
+    return start, stop
+
+
+def _work(name: str, size: int, counter, chunk_size: int, moves_per_game: int, policy: Policy, seed: int,
+          deal: bool):
+    pool = SharedGamePool(size, name)
+    try:
+        start, stop = _claim(counter, chunk_size, size)
+        while start < stop:
+            # The random generator depends on the chunk and not on the worker claiming it, and on the turn the
+            # games are at so that going on with them does not replay the draws of a previous run with this seed
+            turn = 0 if deal else int(pool.games.records["turn"][start])
+            rng = random.Random(f"{seed}:{start}:{turn}")
+            for i in range(start, stop):
+                game = HeadlessGame(rng) if deal else pool.games.load(i, rng)
+                for _ in range(moves_per_game):
+                    player = game.turn % 2 + 1
+                    game.play_turn(player, *policy(game, player))
+                pool.games.store(i, game)
+            start, stop = _claim(counter, chunk_size, size)
+    finally:
+        pool.close()
@@ -0,0 +1,158 @@
+"""
+Elo ratings of players, or of policies playing the game, kept in a SQLite database.
+
+Ratings are updated incrementally as match results arrive, the raw results are not stored so leaderboards only
+read the indexed ratings table.
+"""
+import sqlite3
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+DEFAULT_POLICY = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ratings (
+    player TEXT PRIMARY KEY,
+    policy TEXT NOT NULL,
+    rating REAL NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    losses INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ratings_by_rating ON ratings (rating DESC);
+CREATE INDEX IF NOT EXISTS ratings_by_policy ON ratings (policy, rating DESC);
+"""
+
+
+class MatchResult(NamedTuple):
+    player1: str
+    player2: str
+    # Final Game.scores of the match
+    scores: Sequence[int]
+    policy1: str = DEFAULT_POLICY
+    policy2: str = DEFAULT_POLICY
+
+    @property
+    def outcome(self) -> float:
+        """1 if player1 won, 0.5 for a draw, 0 if player2 won"""
+        if self.scores[0] == self.scores[1]:
+            return 0.5
+        return 1.0 if self.scores[0] > self.scores[1] else 0.0
+
+
+class Rating(NamedTuple):
+    player: str
+    policy: str
+    rating: float
+    games: int
+    wins: int
+    draws: int
+    losses: int
+
+
+class PolicyStats(NamedTuple):
+    policy: str
+    players: int
+    mean_rating: float
+    best_rating: float
+    games: int
+
+
+def expected_score(rating1: float, rating2: float) -> float:
+    """Expected outcome of a match for the first player."""
+    return 1 / (1 + 10 ** ((rating2 - rating1) / 400))
+
+
+class RatingStore:
+    def __init__(self, path: str, k_factor: float = K_FACTOR) -> None:
+        """
+        :param path: database file, created if it does not exist
+        """
+        self.k_factor = k_factor
+        # Transactions are opened explicitly by record
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        # WAL lets readers query leaderboards while results are written
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> "RatingStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _load(self, players: Iterable[str]) -> dict:
+        players = list(players)
+        ratings = {}
+        # Stay under the default limit of SQLite on the number of parameters
+        for start in range(0, len(players), 500):
+            chunk = players[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT * FROM ratings WHERE player IN ({','.join('?' * len(chunk))})", chunk)
+            for row in rows:
+                ratings[row[0]] = list(row)
+        return ratings
+
+    def record(self, results: Iterable[MatchResult]):
+        """
+        Update the ratings with a batch of results, in order, within a single transaction.
+        The transaction takes the write lock before reading the ratings, so concurrent writers are serialized
+        instead of overwriting each other's updates.
+        """
+        results = list(results)
+        for result in results:
+            if result.player1 == result.player2:
+                raise ValueError(f"{result.player1} cannot play against themselves")
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._update(results)
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def _update(self, results: List[MatchResult]):
+        ratings = self._load({result.player1 for result in results} | {result.player2 for result in results})
+
+        for result in results:
+            for player, policy in [(result.player1, result.policy1), (result.player2, result.policy2)]:
+                if player not in ratings:
+                    ratings[player] = [player, policy, INITIAL_RATING, 0, 0, 0, 0]
+
+            first, second = ratings[result.player1], ratings[result.player2]
+            outcome = result.outcome
+            delta = self.k_factor * (outcome - expected_score(first[2], second[2]))
+            first[2] += delta
+            second[2] -= delta
+
+            for row, score in [(first, outcome), (second, 1 - outcome)]:
+                row[3] += 1
+                row[4 if score == 1 else 5 if score == 0.5 else 6] += 1
+
+        self.connection.executemany("INSERT OR REPLACE INTO ratings VALUES (?, ?, ?, ?, ?, ?, ?)", ratings.values())
+
+    def rating(self, player: str) -> Optional[Rating]:
+        row = self.connection.execute("SELECT * FROM ratings WHERE player = ?", (player,)).fetchone()
+        return Rating(*row) if row else None
+
+    def leaderboard(self, limit: int = 10, policy: str = None) -> List[Rating]:
+        """Best rated players, among the players of a policy if one is given."""
+        if policy is None:
+            rows = self.connection.execute("SELECT * FROM ratings ORDER BY rating DESC LIMIT ?", (limit,))
+        else:
+            rows = self.connection.execute(
+                "SELECT * FROM ratings WHERE policy = ? ORDER BY rating DESC LIMIT ?", (policy, limit))
+        return [Rating(*row) for row in rows]
+
+    def compare_policies(self) -> List[PolicyStats]:
+        """Statistics of every policy, best mean rating first."""
+        rows = self.connection.execute(
+            "SELECT policy, COUNT(*), AVG(rating), MAX(rating), SUM(games) FROM ratings "
+            "GROUP BY policy ORDER BY AVG(rating) DESC")
+        return [PolicyStats(*row) for row in rows]
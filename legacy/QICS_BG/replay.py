@@ -0,0 +1,113 @@
+"""
+Compact recording of a game and random access replay.
+
+Each move is stored on one byte: the card, the qubit, and who scored after the move. Replaying only needs the
+transition tables of QICS_BG.packed, keyframes are kept every KEYFRAME_INTERVAL moves so any move can be reached
+by applying at most KEYFRAME_INTERVAL - 1 moves.
+"""
+from typing import List, NamedTuple, Sequence, Tuple
+
+from QICS_BG.constants import *
+from QICS_BG.packed import OPERATION_INDEX, OPERATIONS, apply_move, disentangle
+
+KEYFRAME_INTERVAL = 64
+
+
+def encode_move(operation: int, qubit: int, winner: int = 0, points: int = 0) -> int:
+    """
+    Encode a move on one byte.
+    :param operation: index of the card in OPERATIONS
+    :param qubit: 0 or 1
+    :param winner: result of Game.check_win after the move
+    :param points: points scored by the winner, 1 or 2 with the entangled pair
+    """
+    return qubit | operation << 1 | winner << 4 | (points == 2) << 6
+
+
+def decode_move(code: int) -> Tuple[int, int, int, int]:
+    """Inverse of encode_move, returns (operation, qubit, winner, points)."""
+    winner = code >> 4 & 3
+    points = 0 if not winner else 1 + (code >> 6 & 1)
+    return code >> 1 & 7, code & 1, winner, points
+
+
+class Recording:
+    def __init__(self, start: int, scores: Sequence[int] = (0, 0), moves: bytes = b"") -> None:
+        self.start = start
+        self.start_scores = tuple(scores)
+        self.moves = bytearray(moves)
+
+    def record(self, card: str, qubit: int, winner: int = 0, points: int = 0):
+        self.moves.append(encode_move(OPERATION_INDEX[card], qubit, winner, points))
+
+    def copy(self) -> "Recording":
+        return Recording(self.start, self.start_scores, self.moves)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+
+class Frame(NamedTuple):
+    """Position after index moves."""
+    index: int
+    state: int
+    scores: Tuple[int, int]
+
+
+def _step(frame: Frame, code: int) -> Frame:
+    operation, qubit, winner, points = decode_move(code)
+    state = apply_move(frame.state, operation, qubit)
+    scores = frame.scores
+    if winner:
+        # A point disentangles the qubits
+        state = disentangle(state)
+        scores = (scores[0] + points, scores[1]) if winner == 1 else (scores[0], scores[1] + points)
+    return Frame(frame.index + 1, state, scores)
+
+
+class Replay:
+    def __init__(self, recording: Recording, keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        self.recording = recording
+        self.keyframe_interval = keyframe_interval
+        self.keyframes: List[Frame] = []
+        self._extend_keyframes()
+
+    def _extend_keyframes(self):
+        """Compute the keyframes of the moves recorded since the last call."""
+        if not self.keyframes:
+            self.keyframes.append(Frame(0, self.recording.start, self.recording.start_scores))
+
+        frame = self.keyframes[-1]
+        moves = self.recording.moves
+        last = len(moves) // self.keyframe_interval * self.keyframe_interval
+        while frame.index < last:
+            frame = _step(frame, moves[frame.index])
+            if frame.index % self.keyframe_interval == 0:
+                self.keyframes.append(frame)
+
+    def __len__(self) -> int:
+        return len(self.recording)
+
+    def seek(self, index: int) -> Frame:
+        """Position after index moves, 0 being the start of the game."""
+        if not 0 <= index <= len(self.recording):
+            raise IndexError(f"Move {index} out of range")
+        self._extend_keyframes()
+
+        frame = self.keyframes[index // self.keyframe_interval]
+        moves = self.recording.moves
+        while frame.index < index:
+            frame = _step(frame, moves[frame.index])
+        return frame
+
+    def move(self, index: int) -> Tuple[str, int]:
+        """Card and qubit of a move, as stored in Game.board_content."""
+        operation, qubit, _, _ = decode_move(self.recording.moves[index])
+        return OPERATIONS[operation], qubit
+
+    def panel(self, index: int) -> List[Tuple[str, int]]:
+        """Moves shown on the board after index moves, NB_SLOTS at most like Board.update_ui."""
+        if index == 0:
+            return []
+        first = (index - 1) // NB_SLOTS * NB_SLOTS
+        return [self.move(i) for i in range(first, index)]
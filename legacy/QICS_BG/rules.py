@@ -0,0 +1,110 @@
+"""
+Rules of the game used by the packed engine, declared in a JSON file and compiled into integer tables.
+
+A rules file gives the hand size, the number of objectives and the gates, each with a name, a weight when cards
+are drawn and a type:
+ - "flip": X, Y, Z like rotation around "axis"
+ - "half": SX, SY, SZ like rotation around "axis"
+ - "permutation": explicit "map" from every state to its image
+ - "entangle": the E card
+
+rules.json next to this module holds the classic rules, the ones Game plays with hard coded tables. They are used
+wherever moves of a Game are encoded: the engine, replays, hints and analysis. The environment variable QICS_RULES
+can name another file for DEFAULT_RULES, the rules of HeadlessGame and of the simulations built on it.
+"""
+import json
+import os
+import struct
+from itertools import accumulate
+from typing import Dict, List
+
+from QICS_BG.constants import *
+from QICS_BG.game import (EMPTY_STATE, OPERATIONS, OPERATIONS_WEIGHTS, ROTATIONS, STATE_INDEX, STATES,
+                          STATE_TO_AXIS)
+
+# Cards are stored on 3 bits in replays
+MAX_GATES = 8
+
+CLASSIC_RULES_PATH = os.path.join(os.path.dirname(__file__), "rules.json")
+
+
+class Rules:
+    """Compiled rules, see compile_rules"""
+
+    def __init__(self, operations: List[str], weights: List[int], rotation_table: List[List[int]], entangle: int,
+                 hand_size: int, nb_objectives: int) -> None:
+        self.operations = operations
+        self.operation_index = {operation: i for i, operation in enumerate(operations)}
+        self.weights = weights
+        self.cum_weights = list(accumulate(weights))
+        # rotation_table[operation][state] is the index of the rotated state, EMPTY_STATE stays EMPTY_STATE
+        self.rotation_table = rotation_table
+        # Index of the entangle card, -1 if there is none
+        self.entangle = entangle
+        self.hand_size = hand_size
+        self.nb_objectives = nb_objectives
+        # Whole game: packed state, turn, scores, hands then objectives of both players
+        self.record = struct.Struct(f"<HI2H{2 * hand_size}B{2 * nb_objectives}B")
+
+
+def _gate_row(gate: dict) -> List[int]:
+    kind = gate.get("type")
+    if kind in ["flip", "half"]:
+        if gate.get("axis") not in STATE_TO_AXIS.values():
+            raise ValueError(f"Invalid axis for gate {gate['name']}: {gate.get('axis')}")
+        rotation = gate["axis"] if kind == "flip" else "S" + gate["axis"]
+        row = ROTATIONS[rotation][:len(STATES)]
+    elif kind == "permutation":
+        mapping: Dict[str, str] = gate.get("map", {})
+        if sorted(mapping) != sorted(STATES) or sorted(mapping.values()) != sorted(STATES):
+            raise ValueError(f"The map of gate {gate['name']} is not a permutation of {STATES}")
+        row = [STATE_INDEX[mapping[state]] for state in STATES]
+    elif kind == "entangle":
+        row = list(range(len(STATES)))
+    else:
+        raise ValueError(f"Unknown type for gate {gate['name']}: {kind}")
+
+    # Rotating an empty qubit does nothing
+    return row + [EMPTY_STATE]
+
+
+def compile_rules(config: dict) -> Rules:
+    gates = config["gates"]
+    if not 0 < len(gates) <= MAX_GATES:
+        raise ValueError(f"Between 1 and {MAX_GATES} gates are allowed, got {len(gates)}")
+
+    names = [gate["name"] for gate in gates]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicated gate names in {names}")
+
+    entangles = [i for i, gate in enumerate(gates) if gate.get("type") == "entangle"]
+    if len(entangles) > 1:
+        raise ValueError("Only one entangle gate is allowed")
+
+    return Rules(
+        operations=names,
+        weights=[gate.get("weight", 1) for gate in gates],
+        rotation_table=[_gate_row(gate) for gate in gates],
+        entangle=entangles[0] if entangles else -1,
+        hand_size=config["hand_size"],
+        nb_objectives=config["nb_objectives"],
+    )
+
+
+def load_rules(path: str) -> Rules:
+    with open(path) as file:
+        return compile_rules(json.load(file))
+
+
+def _check_classic(rules: Rules):
+    """The packed tables of the classic rules encode the moves of Game, they must match its hard coded tables."""
+    rotations = [ROTATIONS.get(operation, list(range(EMPTY_STATE + 1))) for operation in OPERATIONS]
+    if (rules.operations != OPERATIONS or rules.weights != OPERATIONS_WEIGHTS or rules.rotation_table != rotations
+            or rules.hand_size != NB_CARDS_HAND or rules.nb_objectives != NB_OBJECTIVES):
+        raise ValueError(f"{CLASSIC_RULES_PATH} does not describe the rules played by Game")
+
+
+CLASSIC_RULES = load_rules(CLASSIC_RULES_PATH)
+_check_classic(CLASSIC_RULES)
+
+DEFAULT_RULES = load_rules(os.environ["QICS_RULES"]) if os.environ.get("QICS_RULES") else CLASSIC_RULES
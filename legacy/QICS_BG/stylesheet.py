@@ -1,4 +1,4 @@
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QColor, QFont
 
 DEFAULT_FONT = QFont("Arial", 12)
 TRANSITION_FONT = QFont("Arial", 20)
@@ -82,6 +82,40 @@ QFrame {
 }
 """
 
+# Colors used to paint the slots of the board view
+SLOT_COLOR = QColor(37, 35, 44)
+CONTENT_COLOR = QColor(255, 255, 255)
+TOKEN_COLOR = QColor(98, 94, 113)
+
+BOARD_VIEW = """
+QTableView {
+    border: none;
+    border-radius: 20px;
+    background-color: rgb(47, 45, 54);
+}
+"""
+
+BOARD_SCROLL_BAR = """
+QScrollBar:horizontal {
+    height: 8px;
+    margin: 0px 20px 0px 20px;
+    border: none;
+    background: transparent;
+}
+QScrollBar::handle:horizontal {
+    min-width: 20px;
+    border-radius: 4px;
+    background: rgb(98, 94, 113);
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0px;
+    border: none;
+}
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+    background: none;
+}
+"""
+
 CHOICE_FRAME = """
 QFrame {
     border: 2px solid rgb(50, 48, 57);
@@ -0,0 +1,73 @@
+import threading
+
+from PyQt5 import QtCore
+
+from QICS_BG.ai import MAX_DEPTH, Suggestion, iter_suggestions
+from QICS_BG.engine import GameSnapshot
+
+
+class SuggestionSignals(QtCore.QObject):
+    # Emitted with (generation, player, suggestion) each time the search finds a deeper move
+    suggested = QtCore.pyqtSignal(int, int, object)
+
+
+class SuggestionTask(QtCore.QRunnable):
+    def __init__(self, service: "MoveSuggestionService", generation: int, snapshot: GameSnapshot, player: int,
+                 max_depth: int) -> None:
+        super().__init__()
+        self.service = service
+        self.generation = generation
+        self.snapshot = snapshot
+        self.player = player
+        self.max_depth = max_depth
+
+    def is_cancelled(self) -> bool:
+        return self.service.generation != self.generation
+
+    def run(self) -> None:
+        for suggestion in iter_suggestions(self.snapshot, self.player, self.max_depth, self.is_cancelled):
+            if self.is_cancelled():
+                return
+            self.service.signals.suggested.emit(self.generation, self.player, suggestion)
+
+
+class MoveSuggestionService(QtCore.QObject):
+    """
+    Computes move suggestions on a thread pool.
+    Every new request or call to cancel makes the running searches stale, their results are then dropped.
+    """
+    suggested = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, parent: QtCore.QObject = None, max_depth: int = MAX_DEPTH) -> None:
+        super().__init__(parent)
+        self.max_depth = max_depth
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        # Signals are emitted from the pool and delivered in the thread of the service
+        self.signals = SuggestionSignals()
+        self.signals.suggested.connect(self._receive)
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def request(self, snapshot: GameSnapshot, player: int):
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self.pool.start(SuggestionTask(self, generation, snapshot, player, self.max_depth))
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+
+    def _receive(self, generation: int, player: int, suggestion: Suggestion):
+        # A newer position may have arrived while the signal was queued
+        if generation != self.generation:
+            return
+        self.suggested.emit(player, suggestion)
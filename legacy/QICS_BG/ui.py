@@ -1,5 +1,5 @@
 from typing import Callable, List
-from PyQt5 import QtCore, QtWidgets, QtGui
+from PyQt5 import QtCore, QtWidgets
 import QICS_BG.stylesheet as stylesheet
 from PyQt5.QtWidgets import QWidget
 
@@ -46,10 +46,6 @@ class Button(QtWidgets.QPushButton):
         self.clicked.disconnect()
         self.clicked.connect(callback)
 
-    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
-        super().resizeEvent(a0)
-        self.setText(self.text)
-
 
 class Entry(QtWidgets.QLineEdit):
     def __init__(self, master: QWidget, height: int) -> None:
@@ -1,14 +1,21 @@
 import os
-from typing import Callable
+import time
+from typing import Callable, Sequence, Tuple
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QWidget, QLabel, QMenu, QGridLayout, QHBoxLayout, QVBoxLayout, QFrame
+from PyQt5.QtWidgets import QWidget, QLabel, QMenu, QHBoxLayout, QVBoxLayout, QFrame
+
+from qats.animation import STATE_VECTORS, Animator, Vector
 
 from QICS_BG.constants import *
-from QICS_BG.game import Game
+from QICS_BG.ai import Suggestion
+from QICS_BG.engine import GameEngine, GameSnapshot, PlayCard
+from QICS_BG.layout import Layout, compute_layout
+from QICS_BG.suggestion import MoveSuggestionService
 from QICS_BG.ui import Button
+from QICS_BG.ui_replay import ReplayWindow
 from QICS_BG.utils import *
 import QICS_BG.stylesheet as stylesheet
 
@@ -18,58 +25,159 @@ class Slot(QtWidgets.QFrame):
         super(Slot, self).__init__(master)
 
         self.setStyleSheet(stylesheet.SLOTS)
-        self.content = None
         self.master = master
         self.content_text = ""
 
-    def set_content(self, content: str, fontsize: int = 20):
-        width, height = self.size().width(), self.size().height()
-        self.content_text = content
+        # A single label, kept the size of the slot by the layout
         self.content = QLabel(self)
-        self.content.setGeometry(0, 0, width, height)
-        self.content.setFont(QFont("Arial", fontsize))
+        self.content.setFont(QFont("Arial", 20))
         self.content.setStyleSheet(stylesheet.FONT_STYLE_CONTENT)
         self.content.setAlignment(Qt.AlignCenter)
-        self.content.setText(content)
-        self.content.show()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.content)
 
-    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
-        super().resizeEvent(a0)
-        self.set_content(self.content_text)
+    def set_content(self, content: str, fontsize: int = None):
+        if fontsize is not None:
+            self.set_font_size(fontsize)
+        if content != self.content_text:
+            self.content_text = content
+            self.content.setText(content)
+
+    def set_font_size(self, fontsize: int):
+        if self.content.font().pointSize() != fontsize:
+            self.content.setFont(QFont("Arial", fontsize))
 
 
-class Board(QtWidgets.QFrame, AbstractObserverUI):
+class QubitSlot(Slot):
+    """Slot of a qubit, its Bloch vector is drawn behind the name of the state"""
+
     def __init__(self, master: QWidget) -> None:
         super().__init__(master)
+        self.vector = None
 
-        self.setStyleSheet(stylesheet.BOARD)
-        self.layout = QGridLayout(self)
-        self.setLayout(self.layout)
+    def set_vector(self, vector: Vector):
+        self.vector = vector
+        self.update()
+
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        super().paintEvent(a0)
+        if self.vector is None:
+            return
+
+        x, y, z = self.vector
+        radius = min(self.width(), self.height()) * 0.4
+        center = QtCore.QPointF(self.width() / 2, self.height() / 2)
+        # X to the right and Z up, Y gives the depth
+        tip = center + QtCore.QPointF(x * radius, -z * radius)
+
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtGui.QPen(stylesheet.TOKEN_COLOR, 2))
+        painter.drawEllipse(center, radius, radius)
+        painter.drawLine(center, tip)
+        painter.setBrush(stylesheet.TOKEN_COLOR)
+        painter.drawEllipse(tip, 4 + 2 * y, 4 + 2 * y)
+        painter.end()
+
+
+class BoardModel(QtCore.QAbstractTableModel):
+    """Moves of the game, one column per move and one row per qubit"""
+
+    def __init__(self, master: QtCore.QObject = None) -> None:
+        super().__init__(master)
+        # History shared with the snapshots, only the first nb_moves moves are shown
+        self.history = ()
+        self.nb_moves = 0
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.nb_moves
+
+    def data(self, index: QtCore.QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        card, qubit = self.history[index.column()]
+        # The entangle card is shown on both qubits
+        if card == "E" or qubit == index.row():
+            return card
+        return ""
+
+    def set_moves(self, history: Sequence[Tuple[str, int]], nb_moves: int):
+        """Only the new moves are inserted, another history or a shorter one means a new game"""
+        if history is not self.history or nb_moves < self.nb_moves:
+            self.beginResetModel()
+            self.history, self.nb_moves = history, nb_moves
+            self.endResetModel()
+        elif nb_moves > self.nb_moves:
+            self.beginInsertColumns(QtCore.QModelIndex(), self.nb_moves, nb_moves - 1)
+            self.nb_moves = nb_moves
+            self.endInsertColumns()
+
+
+class SlotDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints a cell of the board like a Slot, without creating any widget"""
+
+    def __init__(self, master: QtCore.QObject = None) -> None:
+        super().__init__(master)
+        self.font = QFont("Arial", 20)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem,
+              index: QtCore.QModelIndex) -> None:
+        margin = min(option.rect.width(), option.rect.height()) // 20
+        rect = option.rect.adjusted(margin, margin, -margin, -margin)
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(stylesheet.SLOT_COLOR)
+        painter.drawRoundedRect(QtCore.QRectF(rect), 20, 20)
+
+        painter.setPen(stylesheet.CONTENT_COLOR)
+        painter.setFont(self.font)
+        painter.drawText(rect, Qt.AlignCenter, index.data())
+        painter.restore()
+
+
+class Board(QtWidgets.QTableView, AbstractObserverUI):
+    """Whole history of the moves, NB_SLOTS moves are visible and older ones can be scrolled back to"""
 
-        self.slots = []
-        # 4 steps to get to the end
-        for i in range(NB_SLOTS):
-            _slots = [Slot(self), Slot(self)]
-            self.layout.addWidget(_slots[0], 0, i)
-            self.layout.addWidget(_slots[1], 1, i)
-            self.slots.append(tuple(_slots))
+    def __init__(self, master: QWidget) -> None:
+        super().__init__(master)
+
+        self.setStyleSheet(stylesheet.BOARD_VIEW)
+        self.setShowGrid(False)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.horizontalScrollBar().setStyleSheet(stylesheet.BOARD_SCROLL_BAR)
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+
+        self.board_model = BoardModel(self)
+        self.setModel(self.board_model)
+        self.delegate = SlotDelegate(self)
+        self.setItemDelegate(self.delegate)
+
+    def apply_layout(self, layout: Layout):
+        self.setGeometry(QtCore.QRect(*layout.board))
+        self.horizontalHeader().setDefaultSectionSize(layout.column_width)
+        if self.delegate.font.pointSize() != layout.slot_font:
+            self.delegate.font = QFont("Arial", layout.slot_font)
+            self.viewport().update()
 
     def update_ui(self):
-        game = Game()
-        nb_panels = (len(game.board_content) - 1) // NB_SLOTS
-        # New Panel
-        if (len(game.board_content) - 1) % NB_SLOTS == 0:
-            self.clean_slots()
-        shown_content = game.board_content[nb_panels * NB_SLOTS:nb_panels * NB_SLOTS + 6]
-        for i, (card, qubit) in enumerate(shown_content):
-            if card == "E":
-                self.slots[i][1 - qubit].set_content(card)
-            self.slots[i][qubit].set_content(card)
-
-    def clean_slots(self):
-        for i in range(NB_SLOTS):
-            self.slots[i][0].set_content("")
-            self.slots[i][1].set_content("")
+        game = UiMainWindow.instance.snapshot
+        self.board_model.set_moves(game.history, game.nb_moves)
+
+        # Follow the last move
+        if game.nb_moves:
+            self.scrollTo(self.board_model.index(0, game.nb_moves - 1))
 
 
 class TitleBar(QtWidgets.QFrame):
@@ -77,7 +185,6 @@ class TitleBar(QtWidgets.QFrame):
         super(TitleBar, self).__init__(master)
 
         self.button_exit = QtWidgets.QPushButton(master)
-        self.button_exit.setGeometry(QtCore.QRect(1250, 10, 20, 20))
         self.button_exit.setStyleSheet(stylesheet.EXIT_BUTTON)
         self.button_exit.clicked.connect(window_close_fn)
 
@@ -85,10 +192,14 @@ class TitleBar(QtWidgets.QFrame):
 
         self.window = window
 
-        self.setGeometry(0, 0, WINDOW_WIDTH, TITLE_BAR_HEIGHT)
         self.setStyleSheet(stylesheet.TITLE_BAR)
         self.show()
 
+    def apply_layout(self, layout: Layout):
+        self.setGeometry(QtCore.QRect(*layout.title_bar))
+        self.button_exit.setGeometry(QtCore.QRect(*layout.exit_button))
+        self.button_exit.raise_()
+
     def mousePressEvent(self, event) -> None:
         self.oldPos = event.globalPos()
 
@@ -142,6 +253,8 @@ class UiButtonsPlayer(QtWidgets.QFrame, AbstractObserverUI):
 
         win = UiMainWindow.instance
         win.add_observer(self.frames["player2"])
+        if win.current_layout is not None:
+            self.frames["player2"].apply_layout(win.current_layout)
 
     def player1_frame(self):
         if "player1" in self.frames.keys():
@@ -155,6 +268,14 @@ class UiButtonsPlayer(QtWidgets.QFrame, AbstractObserverUI):
 
         win = UiMainWindow.instance
         win.add_observer(self.frames["player1"])
+        if win.current_layout is not None:
+            self.frames["player1"].apply_layout(win.current_layout)
+
+    def apply_layout(self, layout: Layout):
+        self.setGeometry(QtCore.QRect(*layout.buttons))
+        for frame in self.frames.values():
+            if isinstance(frame, HandFrame):
+                frame.apply_layout(layout)
 
     def update_ui(self):
         self.player_choice_frame()
@@ -175,39 +296,36 @@ class HandFrame(QtWidgets.QFrame, AbstractObserverUI):
         self.upper_part = QtWidgets.QFrame(self)
         self.lower_part = QtWidgets.QFrame(self)
 
-        self.layout.addWidget(self.upper_part, 2)
-        self.layout.addWidget(self.lower_part, 1)
+        self.layout.addWidget(self.upper_part, HAND_CARDS_STRETCH)
+        self.layout.addWidget(self.lower_part, HAND_OBJECTIVES_STRETCH)
 
         self.setLayout(self.layout)
 
         upper_layout = QHBoxLayout(self.upper_part)
         lower_layout = QHBoxLayout(self.lower_part)
 
-        game = Game()
         win = UiMainWindow.instance
+        game = win.snapshot
 
         # Return button
         exit_button = QtWidgets.QPushButton(self)
-        exit_button.setGeometry(QtCore.QRect(0, 0, 40, 20))
+        exit_button.setGeometry(QtCore.QRect(0, 0, RETURN_BUTTON_WIDTH, 20))
         exit_button.clicked.connect(master.player_choice_frame)
         exit_button.setIcon(QtGui.QIcon(QtGui.QPixmap(master.image_path)))
         exit_button.setStyleSheet(stylesheet.DEFAULT_BUTTON)
-        exit_button.setMaximumWidth(40)
+        exit_button.setMaximumWidth(RETURN_BUTTON_WIDTH)
         upper_layout.addWidget(exit_button, 1, alignment=Qt.AlignLeft | Qt.AlignTop)
 
         for i in range(NB_CARDS_HAND):
             button = Button(self, "", lambda: 0)
-            button.setMaximumWidth(100)
-            button.setMaximumHeight(100)
-            button.setMinimumWidth(100)
-            button.setMinimumHeight(100)
+            button.setFixedSize(CARD_SIZE, CARD_SIZE)
 
             self.hand_slots.append(button)
             upper_layout.addWidget(button, 3, alignment=Qt.AlignCenter)
 
             menu = QMenu(f'Card {i}, player {player}')
-            fc = lambda i=i: game.play_turn(self.player, i, 0, win.send_signal)
-            fc2 = lambda i=i: game.play_turn(self.player, i, 1, win.send_signal)
+            fc = lambda i=i: win.engine.submit(PlayCard(self.player, i, 0))
+            fc2 = lambda i=i: win.engine.submit(PlayCard(self.player, i, 1))
             menu.addAction("Play on 1st qubit", fc)
             menu.addAction("Play on 2nd qubit", fc2)
 
@@ -224,13 +342,14 @@ class HandFrame(QtWidgets.QFrame, AbstractObserverUI):
                 slot.setFont(QFont("Arial", 12))
                 slot.setStyleSheet(stylesheet.FONT_STYLE_CONTENT)
                 slot.setAlignment(Qt.AlignCenter)
-                slot.setMaximumWidth(50)
-                slot.setMinimumWidth(50)
-                slot.setMinimumHeight(50)
+                slot.setFixedSize(OBJECTIVE_SIZE, OBJECTIVE_SIZE)
                 slot.show()
             container = QFrame(self)
-            container.setMaximumWidth(100)
+            container.setMaximumWidth(2 * OBJECTIVE_SIZE)
             objective_layout = QVBoxLayout()
+            # The size of the labels is bounded by the height left to them, the margins are not
+            objective_layout.setContentsMargins(0, 0, 0, 0)
+            objective_layout.setSpacing(0)
             objective_layout.addWidget(slots[0], 1, alignment=Qt.AlignCenter)
             objective_layout.addWidget(slots[1], 1, alignment=Qt.AlignCenter)
             container.setLayout(objective_layout)
@@ -248,14 +367,56 @@ class HandFrame(QtWidgets.QFrame, AbstractObserverUI):
             lower_layout.addWidget(container, 1)
             self.objectives.append(tuple(slots))
 
+        # Hint button, the suggestion is computed in the background
+        hint_container = QFrame(self)
+        hint_layout = QVBoxLayout(hint_container)
+        hint_button = Button(hint_container, "Hint", lambda: win.suggestions.request(win.snapshot, self.player))
+        hint_button.setMinimumHeight(30)
+        self.hint_label = QLabel(hint_container)
+        self.hint_label.setFont(QFont("Arial", 10))
+        self.hint_label.setStyleSheet(stylesheet.FONT_STYLE_CONTENT)
+        self.hint_label.setAlignment(Qt.AlignCenter)
+        hint_layout.addWidget(hint_button, 1)
+        hint_layout.addWidget(self.hint_label, 1)
+        hint_container.setLayout(hint_layout)
+        lower_layout.addWidget(hint_container, 1)
+
+        win.suggestions.suggested.connect(self.show_suggestion)
+
         self.lower_part.setLayout(lower_layout)
 
     def show(self) -> None:
         super(HandFrame, self).show()
         self.update_ui()
 
+    def apply_layout(self, layout: Layout):
+        font = QFont("Arial", layout.card_font)
+        padding = f"QPushButton {{ padding-left: {layout.card_padding}px; padding-right: {layout.card_padding}px; }}"
+        for button in self.hand_slots:
+            button.setFixedSize(layout.card_size, layout.card_size)
+            if button.font() != font:
+                button.setFont(font)
+            # Only restyled when the padding changes, setting a style sheet repolishes the button
+            if not button.styleSheet().endswith(padding):
+                button.setStyleSheet(stylesheet.DEFAULT_BUTTON + padding)
+
+        font = QFont("Arial", layout.objective_font)
+        for slots in self.objectives:
+            for slot in slots:
+                slot.setFixedSize(layout.objective_size, layout.objective_size)
+                if slot.font() != font:
+                    slot.setFont(font)
+
+    def show_suggestion(self, player: int, suggestion: Suggestion):
+        if player != self.player:
+            return
+        self.hint_label.setText(f"Card {suggestion.card_pos + 1} on qubit {suggestion.qubit + 1}\n"
+                                f"{suggestion.probability:.0%} in {suggestion.depth} turns")
+
     def update_ui(self):
-        game = Game()
+        game = UiMainWindow.instance.snapshot
+
+        self.hint_label.setText("")
 
         # Update the hand
         hand = game.get_hand(self.player)
@@ -287,7 +448,7 @@ class PlayerChoiceFrame(QtWidgets.QFrame, AbstractObserverUI):
         button_player2.setMaximumWidth(button_width)
         button_player2.setMinimumHeight(button_height)
 
-        game = Game()
+        game = UiMainWindow.instance.snapshot
 
         self.score_labels = [
             QLabel(f"Score player 1: {game.scores[0]}", self),
@@ -305,10 +466,19 @@ class PlayerChoiceFrame(QtWidgets.QFrame, AbstractObserverUI):
         self.layout.addWidget(self.score_labels[0], 1, 0, alignment=Qt.AlignCenter | Qt.AlignTop)
         self.layout.addWidget(self.score_labels[1], 1, 1, alignment=Qt.AlignCenter | Qt.AlignTop)
 
+        button_replay = Button(self, "Replay", self.open_replay)
+        button_replay.setMaximumWidth(button_width)
+        self.layout.addWidget(button_replay, 2, 0, 1, 2, alignment=Qt.AlignCenter | Qt.AlignTop)
+        self.replay_window = None
+
         self.setLayout(self.layout)
 
+    def open_replay(self):
+        self.replay_window = ReplayWindow(UiMainWindow.instance.engine.replay())
+        self.replay_window.show()
+
     def update_ui(self):
-        game = Game()
+        game = UiMainWindow.instance.snapshot
 
         self.score_labels[0].setText(f"Score player 1: {game.scores[0]}")
         self.score_labels[1].setText(f"Score player 2: {game.scores[1]}")
@@ -324,7 +494,7 @@ class CurrentStateFrame(QtWidgets.QFrame, AbstractObserverUI):
 
         self.layout = QtWidgets.QGridLayout(self)
 
-        self.qubits = [Slot(self), Slot(self), Slot(self), Slot(self)]
+        self.qubits = [QubitSlot(self), QubitSlot(self), QubitSlot(self), QubitSlot(self)]
 
         for i in range(len(self.qubits)):
             self.layout.addWidget(self.qubits[i], i % 2, i // 2)
@@ -333,15 +503,50 @@ class CurrentStateFrame(QtWidgets.QFrame, AbstractObserverUI):
 
         self.qubits[0].set_content("0")
         self.qubits[1].set_content("0")
+        self.qubits[0].set_vector(STATE_VECTORS["0"])
+        self.qubits[1].set_vector(STATE_VECTORS["0"])
+        self.states = ["0", "0", "", ""]
+
+        # A single timer moves all the qubits
+        self.animator = Animator()
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(16)
+        self.timer.timeout.connect(self.animate)
+
+    def apply_layout(self, layout: Layout):
+        self.setGeometry(QtCore.QRect(*layout.states))
+        for qbit in self.qubits:
+            qbit.set_font_size(layout.qubit_font)
 
     def update_ui(self):
-        game = Game()
+        game = UiMainWindow.instance.snapshot
+        now = time.monotonic()
 
         for i, qbit in enumerate(self.qubits):
-            if game.state[i] != "/":
-                qbit.set_content(str(game.state[i]))
+            state = str(game.state[i])
+            qbit.set_content(state)
+
+            if state and self.states[i]:
+                self.animator.start(i, self.states[i], state, now)
             else:
-                qbit.set_content("")
+                # Entangled qubits appear and disappear without transition
+                self.animator.cancel(i, finish=False)
+                qbit.set_vector(STATE_VECTORS[state] if state else None)
+            self.states[i] = state
+
+        if self.animator.active and not self.timer.isActive():
+            self.timer.start()
+
+    def animate(self):
+        for i, frame in self.animator.tick().items():
+            self.qubits[i].set_vector(frame.vector)
+        if not self.animator.active:
+            self.timer.stop()
+
+
+class SnapshotSignal(QtCore.QObject):
+    """Carries the snapshots published by the engine thread to the GUI thread"""
+    published = QtCore.pyqtSignal(object)
 
 
 class UiMainWindow(QtWidgets.QMainWindow):
@@ -351,15 +556,19 @@ class UiMainWindow(QtWidgets.QMainWindow):
         super().__init__()
         UiMainWindow.instance = self
         self.update_observers = []
+        self.current_layout = None
 
-        self.setup()
-        TitleBar(self.centralWidget, lambda: self.close(), self)
-        self.contentWidget.setGeometry(0, TITLE_BAR_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT - TITLE_BAR_HEIGHT)
-        self.layout = QtWidgets.QVBoxLayout(self.contentWidget)
+        self.engine = GameEngine()
+        self.snapshot = self.engine.snapshot
+        self.snapshot_signal = SnapshotSignal()
+        self.snapshot_signal.published.connect(self.receive_snapshot)
+        self.engine.subscribe(self.snapshot_signal.published.emit)
+        self.suggestions = MoveSuggestionService(self)
 
-        self.board_widget = QtWidgets.QWidget(self.contentWidget)
-        self.board_layout = QtWidgets.QHBoxLayout()
+        self.setup()
+        self.title_bar = TitleBar(self.centralWidget, lambda: self.close(), self)
 
+        # Placed by apply_layout rather than by Qt layouts, see QICS_BG.layout
         self.uiButtonPlayer = UiButtonsPlayer(self.contentWidget)
         self.board = Board(self.contentWidget)
         self.states_ui = CurrentStateFrame(self.contentWidget)
@@ -368,14 +577,9 @@ class UiMainWindow(QtWidgets.QMainWindow):
         self.add_observer(self.states_ui)
         self.add_observer(self.board)
 
-        self.layout.addWidget(self.uiButtonPlayer, 5)
-        self.layout.addWidget(self.board_widget, 6)
-
-        self.board_layout.addWidget(self.board, NB_SLOTS)
-        self.board_layout.addWidget(self.states_ui, 2)
+        self.apply_layout(compute_layout(self.width(), self.height(), self.logicalDpiX()))
 
-        self.contentWidget.setLayout(self.layout)
-        self.board_widget.setLayout(self.board_layout)
+        self.engine.start()
 
     def setup(self):
         self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -389,13 +593,42 @@ class UiMainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("QICS Quantum board game")
         self.setWindowFlag(QtCore.Qt.FramelessWindowHint)
 
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        if self.current_layout is None:
+            # Widgets are not created yet, the constructor applies the first layout
+            return
+        self.apply_layout(compute_layout(a0.size().width(), a0.size().height(), self.logicalDpiX()))
+
+    def apply_layout(self, layout: Layout):
+        """Move every widget to its place in a single pass, the window is repainted once at the end"""
+        if layout == self.current_layout:
+            return
+        self.current_layout = layout
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.title_bar.apply_layout(layout)
+            self.contentWidget.setGeometry(QtCore.QRect(*layout.content))
+            self.uiButtonPlayer.apply_layout(layout)
+            self.board.apply_layout(layout)
+            self.states_ui.apply_layout(layout)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def add_observer(self, observer: AbstractObserverUI):
         self.update_observers.append(observer)
 
-    def send_signal(self):
-        # Check winning condition
-        game = Game()
-        game.check_win()
+    def receive_snapshot(self, snapshot: GameSnapshot):
+        self.snapshot = snapshot
+        # Suggestions computed for the previous position are outdated
+        self.suggestions.cancel()
+        self.send_signal()
+
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        self.engine.stop()
+        super().closeEvent(a0)
 
+    def send_signal(self):
         for observer in self.update_observers:
             observer.update_ui()
@@ -0,0 +1,84 @@
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout, QSlider
+
+from QICS_BG.constants import *
+from QICS_BG.packed import unpack_state
+from QICS_BG.replay import Replay
+import QICS_BG.stylesheet as stylesheet
+
+
+def _content_label(master: QWidget, fontsize: int = 20) -> QLabel:
+    label = QLabel(master)
+    label.setFont(QFont("Arial", fontsize))
+    label.setStyleSheet(stylesheet.FONT_STYLE_CONTENT)
+    label.setAlignment(Qt.AlignCenter)
+    return label
+
+
+class ReplayWindow(QtWidgets.QWidget):
+    """Window showing a recorded game at any move, the slider seeks through the whole history"""
+
+    def __init__(self, replay: Replay, master: QWidget = None) -> None:
+        super().__init__(master)
+        self.replay = replay
+
+        self.resize(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+        self.setStyleSheet(stylesheet.WINDOW)
+        self.setWindowTitle("QICS Quantum board game - Replay")
+
+        self.layout = QGridLayout(self)
+
+        # Board panel, the labels are reused for every position
+        board = QtWidgets.QFrame(self)
+        board.setStyleSheet(stylesheet.BOARD)
+        board_layout = QGridLayout(board)
+        self.slots = []
+        for i in range(NB_SLOTS):
+            _slots = [_content_label(board), _content_label(board)]
+            board_layout.addWidget(_slots[0], 0, i)
+            board_layout.addWidget(_slots[1], 1, i)
+            self.slots.append(tuple(_slots))
+        board.setLayout(board_layout)
+
+        states = QtWidgets.QFrame(self)
+        states.setStyleSheet(stylesheet.BOARD)
+        states_layout = QGridLayout(states)
+        self.qubits = [_content_label(states) for _ in range(4)]
+        for i, qubit in enumerate(self.qubits):
+            states_layout.addWidget(qubit, i % 2, i // 2)
+        states.setLayout(states_layout)
+
+        self.info = _content_label(self, 12)
+
+        self.slider = QSlider(Qt.Horizontal, self)
+        self.slider.setRange(0, len(replay))
+        self.slider.valueChanged.connect(self.show_move)
+
+        self.layout.addWidget(board, 0, 0)
+        self.layout.addWidget(states, 0, 1)
+        self.layout.addWidget(self.info, 1, 0, 1, 2)
+        self.layout.addWidget(self.slider, 2, 0, 1, 2)
+        self.setLayout(self.layout)
+
+        self.slider.setValue(len(replay))
+        self.show_move(len(replay))
+
+    def show_move(self, index: int):
+        frame = self.replay.seek(index)
+
+        panel = self.replay.panel(index)
+        for i in range(NB_SLOTS):
+            for qubit in range(2):
+                self.slots[i][qubit].setText("")
+        for i, (card, qubit) in enumerate(panel):
+            if card == "E":
+                self.slots[i][1 - qubit].setText(card)
+            self.slots[i][qubit].setText(card)
+
+        for label, state in zip(self.qubits, unpack_state(frame.state)):
+            label.setText(state if state else "")
+
+        self.info.setText(f"Move {index}/{len(self.replay)}    "
+                          f"Score player 1: {frame.scores[0]}    Score player 2: {frame.scores[1]}")
@@ -0,0 +1,176 @@
+"""
+Micro-benchmarks of the game engine.
+
+    python benchmark.py                  # run and compare with the stored baseline if there is one
+    python benchmark.py --save-baseline  # run and store the results as the new baseline
+
+The rotate, apply_rotation and check_win measures reset the game before every call, the reset is part of the
+measured rate.
+"""
+import argparse
+import json
+import os
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+from QICS_BG.game import BASIS, OPERATIONS, STATES, Game, State
+from QICS_BG.headless import HeadlessGame
+from QICS_BG.utils import Singleton
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+def ops_per_second(function: Callable, number: int, repeat: int = 5, setup: Callable = None) -> float:
+    """
+    Best rate over several runs.
+    :param setup: called before each call of function within the timed loop, the rate includes its cost
+    """
+    measured = function
+    if setup is not None:
+        def measured():
+            setup()
+            function()
+
+    return number / min(timeit.repeat(measured, number=number, repeat=repeat))
+
+
+def new_game() -> Game:
+    """A fresh Game, the singleton is reset."""
+    Singleton._instances.pop(Game, None)
+    return Game()
+
+
+def bench_rotate(number: int) -> Dict[str, float]:
+    # E is not a rotation, it is measured with apply_rotation
+    results = {}
+    for rotation in BASIS:
+        for state in STATES:
+            qubit = State(state)
+            start = qubit.index
+
+            def reset():
+                # Otherwise the next calls rotate the image of state
+                qubit.index = start
+
+            results[f"rotate[{rotation},{state}]"] = ops_per_second(lambda: qubit.rotate(rotation), number,
+                                                                    setup=reset)
+    return results
+
+
+def bench_apply_rotation(number: int) -> Dict[str, float]:
+    game = new_game()
+    start = [state.index for state in game.state], game.entangled
+
+    def reset():
+        # Every call starts from the initial position of the game
+        for state, index in zip(game.state, start[0]):
+            state.index = index
+        game.entangled = start[1]
+
+    results = {}
+    for operation in OPERATIONS:
+        for qubit in range(2):
+            results[f"apply_rotation[{operation},{qubit}]"] = ops_per_second(
+                lambda: game.apply_rotation(operation, qubit), number, setup=reset)
+    return results
+
+
+def bench_check_win(number: int) -> Dict[str, float]:
+    game = new_game()
+    results = {}
+
+    def miss():
+        game.objectives[0][0] = ["1", "1"]
+        game.state[0].set_state("0")
+
+    def hit():
+        # The objective is redrawn by check_win so it is set again before each call
+        game.objectives[0][0] = ["1", "1"]
+        game.state[0].set_state("1")
+        game.state[1].set_state("1")
+
+    results["check_win[miss]"] = ops_per_second(game.check_win, number, setup=miss)
+    results["check_win[hit]"] = ops_per_second(game.check_win, number, setup=hit)
+    return results
+
+
+def bench_play_turn(number: int) -> Dict[str, float]:
+    game = new_game()
+    turn = [0]
+
+    def play():
+        game.play_turn(turn[0] % 2 + 1, turn[0] % 6, turn[0] % 4 // 2, lambda: None)
+        game.check_win()
+        turn[0] += 1
+
+    headless = HeadlessGame()
+
+    def play_headless():
+        headless.play_turn(turn[0] % 2 + 1, turn[0] % 6, turn[0] % 4 // 2)
+        turn[0] += 1
+
+    return {
+        "play_turn": ops_per_second(play, number),
+        "headless.play_turn": ops_per_second(play_headless, number),
+    }
+
+
+def memory_per_game(nb_games: int = 1000) -> Dict[str, float]:
+    """Bytes allocated per game, the board history is empty."""
+    results = {}
+    for name, factory in [("memory[Game]", new_game), ("memory[HeadlessGame]", HeadlessGame)]:
+        factory()
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        games = []
+        for _ in range(nb_games):
+            games.append(factory())
+            # Keep every Game alive despite the singleton
+            Singleton._instances.pop(Game, None)
+        results[name] = (tracemalloc.get_traced_memory()[0] - start) / nb_games
+        tracemalloc.stop()
+    return results
+
+
+def run(number: int) -> Dict[str, float]:
+    results = {}
+    results.update(bench_rotate(number))
+    results.update(bench_apply_rotation(number))
+    results.update(bench_check_win(number))
+    results.update(bench_play_turn(number))
+    results.update(memory_per_game())
+    return results
+
+
+def report(results: Dict[str, float], baseline: Dict[str, float] = None):
+    for name, value in results.items():
+        unit = "B/game" if name.startswith("memory") else "ops/s"
+        line = f"{name:32} {value:16,.0f} {unit}"
+        if baseline and name in baseline:
+            line += f"  ({value / baseline[name]:.2f}x baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the game engine")
+    parser.add_argument("--number", type=int, default=10000, help="calls per measure")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    args = parser.parse_args()
+
+    results = run(args.number)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    report(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
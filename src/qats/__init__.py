@@ -1 +1,7 @@
-from .main import main_loop
+def __getattr__(name):
+    # main_loop needs pygame and numpy, it is only imported when used so that the standard library modules of the
+    # package, like qats.animation, can be imported by the Qt client
+    if name == "main_loop":
+        from .main import main_loop
+        return main_loop
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,192 @@
+"""
+Animation of qubit tokens between the orientations of the Bloch sphere matching the six states of the game.
+
+This module only depends on the standard library so both the Qt client and the pygame renderer can use it: the
+client calls Animator.tick from its timer and draws the returned frames.
+"""
+import math
+import time
+from typing import Dict, Hashable, List, NamedTuple, Tuple
+
+Quaternion = Tuple[float, float, float, float]
+Vector = Tuple[float, float, float]
+
+STATE_VECTORS: Dict[str, Vector] = {
+    "0": (0.0, 0.0, 1.0),
+    "1": (0.0, 0.0, -1.0),
+    "+": (1.0, 0.0, 0.0),
+    "-": (-1.0, 0.0, 0.0),
+    "+i": (0.0, 1.0, 0.0),
+    "-i": (0.0, -1.0, 0.0),
+}
+
+IDENTITY: Quaternion = (1.0, 0.0, 0.0, 0.0)
+NB_KEYFRAMES = 16
+DURATION = 0.3
+
+
+def normalize(q: Quaternion) -> Quaternion:
+    norm = math.sqrt(sum(c * c for c in q))
+    return q[0] / norm, q[1] / norm, q[2] / norm, q[3] / norm
+
+
+def from_to(a: Vector, b: Vector) -> Quaternion:
+    """Shortest rotation sending the unit vector a to the unit vector b."""
+    dot = a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+    if dot > 1 - 1e-9:
+        return IDENTITY
+    if dot < -1 + 1e-9:
+        # Half turn around any axis orthogonal to a
+        axis = (0.0, -a[2], a[1]) if abs(a[0]) < 0.9 else (-a[2], 0.0, a[0])
+        return normalize((0.0, *axis))
+    cross = (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+    return normalize((1 + dot, *cross))
+
+
+def slerp(q0: Quaternion, q1: Quaternion, t: float) -> Quaternion:
+    dot = sum(c0 * c1 for c0, c1 in zip(q0, q1))
+    if dot < 0:
+        q1, dot = tuple(-c for c in q1), -dot
+    if dot > 1 - 1e-9:
+        return nlerp(q0, q1, t)
+    theta = math.acos(dot)
+    s0 = math.sin((1 - t) * theta) / math.sin(theta)
+    s1 = math.sin(t * theta) / math.sin(theta)
+    return normalize(tuple(s0 * c0 + s1 * c1 for c0, c1 in zip(q0, q1)))
+
+
+def nlerp(q0: Quaternion, q1: Quaternion, t: float) -> Quaternion:
+    """Cheap interpolation, close to slerp between nearby keyframes."""
+    return normalize(tuple(c0 + t * (c1 - c0) for c0, c1 in zip(q0, q1)))
+
+
+def multiply(q0: Quaternion, q1: Quaternion) -> Quaternion:
+    """Rotation applying q1 then q0."""
+    w0, x0, y0, z0 = q0
+    w1, x1, y1, z1 = q1
+    return (
+        w0 * w1 - x0 * x1 - y0 * y1 - z0 * z1,
+        w0 * x1 + x0 * w1 + y0 * z1 - z0 * y1,
+        w0 * y1 - x0 * z1 + y0 * w1 + z0 * x1,
+        w0 * z1 + x0 * y1 - y0 * x1 + z0 * w1,
+    )
+
+
+def rotate(q: Quaternion, v: Vector) -> Vector:
+    w, x, y, z = q
+    # v + 2 w (u x v) + 2 u x (u x v) with u the vector part of q
+    cx, cy, cz = y * v[2] - z * v[1], z * v[0] - x * v[2], x * v[1] - y * v[0]
+    return (
+        v[0] + 2 * (w * cx + y * cz - z * cy),
+        v[1] + 2 * (w * cy + z * cx - x * cz),
+        v[2] + 2 * (w * cz + x * cy - y * cx),
+    )
+
+
+def to_matrix(q: Quaternion) -> List[List[float]]:
+    """Rotation matrix of a unit quaternion."""
+    w, x, y, z = q
+    return [
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+        [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)],
+    ]
+
+
+def _build_keyframes() -> Dict[Tuple[str, str], List[Quaternion]]:
+    keyframes = {}
+    for start, a in STATE_VECTORS.items():
+        for end, b in STATE_VECTORS.items():
+            rotation = from_to(a, b)
+            keyframes[start, end] = [slerp(IDENTITY, rotation, i / (NB_KEYFRAMES - 1)) for i in range(NB_KEYFRAMES)]
+    return keyframes
+
+
+# Rotations from the start orientation, for every pair of states
+KEYFRAMES = _build_keyframes()
+
+
+def ease(t: float) -> float:
+    return t * t * (3 - 2 * t)
+
+
+class TokenFrame(NamedTuple):
+    start: str
+    end: str
+    # Rotation from the orientation of start, and the resulting Bloch vector
+    rotation: Quaternion
+    vector: Vector
+    done: bool
+
+
+class Animation:
+    __slots__ = ("start", "end", "start_time", "duration", "keyframes")
+
+    def __init__(self, start: str, end: str, start_time: float, duration: float) -> None:
+        self.start = start
+        self.end = end
+        self.start_time = start_time
+        self.duration = duration
+        self.keyframes = KEYFRAMES[start, end]
+
+    def frame(self, now: float) -> TokenFrame:
+        progress = min(1.0, (now - self.start_time) / self.duration) if self.duration > 0 else 1.0
+        if progress >= 1.0:
+            rotation = self.keyframes[-1]
+            return TokenFrame(self.start, self.end, rotation, STATE_VECTORS[self.end], True)
+
+        position = ease(progress) * (NB_KEYFRAMES - 1)
+        i = int(position)
+        rotation = nlerp(self.keyframes[i], self.keyframes[i + 1], position - i)
+        return TokenFrame(self.start, self.end, rotation, rotate(rotation, STATE_VECTORS[self.start]), False)
+
+
+class Animator:
+    """
+    Runs the animations of every token, they are all advanced by a single call to tick.
+    Starting an animation on a token which is still moving cancels the previous one, the token jumps to the end
+    of the cancelled animation so the display never lags behind the game.
+    """
+
+    def __init__(self, duration: float = DURATION) -> None:
+        self.duration = duration
+        self.animations: Dict[Hashable, Animation] = {}
+        # Last frames of the cancelled animations, returned by the next tick
+        self.cancelled: Dict[Hashable, TokenFrame] = {}
+
+    @property
+    def active(self) -> bool:
+        return bool(self.animations or self.cancelled)
+
+    def start(self, key: Hashable, start: str, end: str, now: float = None):
+        running = self.animations.get(key)
+        if start == end and running is not None and running.end == end:
+            # The token is already moving there
+            return
+
+        self.cancel(key)
+        if start is None or end is None or start == end:
+            return
+        now = time.monotonic() if now is None else now
+        self.animations[key] = Animation(start, end, now, self.duration)
+
+    def cancel(self, key: Hashable, finish: bool = True):
+        """
+        Stop the animation of a token.
+        :param finish: if True the next tick returns the last frame of the animation
+        """
+        animation = self.animations.pop(key, None)
+        if animation is not None and finish:
+            self.cancelled[key] = animation.frame(math.inf)
+        elif not finish:
+            self.cancelled.pop(key, None)
+
+    def tick(self, now: float = None) -> Dict[Hashable, TokenFrame]:
+        """Frames of all the running animations, finished ones are returned one last time then removed."""
+        now = time.monotonic() if now is None else now
+        frames = self.cancelled
+        self.cancelled = {}
+        frames.update((key, animation.frame(now)) for key, animation in self.animations.items())
+        for key in [key for key in self.animations if frames[key].done]:
+            del self.animations[key]
+        return frames
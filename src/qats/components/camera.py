@@ -0,0 +1,110 @@
+from typing import List, Sequence
+
+import numpy as np
+
+
+def look_at(eye: np.ndarray, target: np.ndarray, up: np.ndarray) -> np.ndarray:
+    """View matrix of a camera placed at eye and looking at target."""
+    forward = target - eye
+    forward = forward / np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side = side / np.linalg.norm(side)
+    up = np.cross(side, forward)
+
+    return np.array([
+        [*side, -side @ eye],
+        [*up, -up @ eye],
+        [*-forward, forward @ eye],
+        [0, 0, 0, 1],
+    ])
+
+
+def perspective(fov: float, aspect: float, near: float, far: float) -> np.ndarray:
+    """Projection matrix, fov is the vertical field of view in radians."""
+    f = 1 / np.tan(fov / 2)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0],
+    ])
+
+
+class Camera:
+    """
+    Perspective camera projecting world coordinates to screen coordinates.
+
+    By default the camera looks at the plane z = 0 so that a point of this plane is drawn at the pixel given by its
+    x and y coordinates, the z axis going away from the viewer.
+    """
+
+    def __init__(self, width: int, height: int, fov: float = np.pi / 3, near: float = 1, far: float = 10000,
+                 eye: Sequence[float] = None, target: Sequence[float] = None, up: Sequence[float] = (0, -1, 0)):
+        self.width = width
+        self.height = height
+        self.fov = fov
+        self.near = near
+        self.far = far
+
+        distance = height / 2 / np.tan(fov / 2)
+        self.eye = np.array(eye if eye is not None else [width / 2, height / 2, -distance], dtype=float)
+        self.target = np.array(target if target is not None else [width / 2, height / 2, 0], dtype=float)
+        self.up = np.array(up, dtype=float)
+
+        self.update()
+
+    def move(self, eye: Sequence[float] = None, target: Sequence[float] = None):
+        if eye is not None:
+            self.eye = np.array(eye, dtype=float)
+        if target is not None:
+            self.target = np.array(target, dtype=float)
+        self.update()
+
+    def update(self):
+        """Recompute the matrices and the frustum, to call after changing the camera parameters."""
+        self.view = look_at(self.eye, self.target, self.up)
+        self.projection = perspective(self.fov, self.width / self.height, self.near, self.far)
+        self.view_projection = self.projection @ self.view
+
+        # Planes of the frustum (left, right, bottom, top, near, far) as rows (a, b, c, d), inside when
+        # a x + b y + c z + d >= 0
+        m = self.view_projection
+        planes = np.array([m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+        self.planes = planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+    def visible(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        Frustum culling of bounding spheres.
+        :param centers: array of shape (n, 3)
+        :param radii: array of shape (n,)
+        :return: boolean mask of the spheres intersecting the frustum
+        """
+        distances = centers @ self.planes[:, :3].T + self.planes[:, 3]
+        return np.all(distances >= -np.asarray(radii)[:, None], axis=1)
+
+    def is_visible(self, center: np.ndarray, radius: float) -> bool:
+        return bool(self.visible(np.asarray(center, dtype=float)[None, :], np.array([radius]))[0])
+
+    def cull(self, objects: List) -> List:
+        """Objects whose bounding sphere (position, bounding_radius) intersects the frustum."""
+        if not objects:
+            return []
+        centers = np.array([obj.position for obj in objects], dtype=float)
+        radii = np.array([obj.bounding_radius for obj in objects], dtype=float)
+        return [obj for obj, visible in zip(objects, self.visible(centers, radii)) if visible]
+
+    def project(self, points: np.ndarray) -> np.ndarray:
+        """
+        Project world points on the screen in one batch.
+        :param points: array of shape (n, 3)
+        :return: array of shape (n, 3) holding the pixel coordinates and the depth in [-1, 1]
+        """
+        homogeneous = np.hstack([points, np.ones((len(points), 1))])
+        clip = homogeneous @ self.view_projection.T
+        ndc = clip[:, :3] / clip[:, 3:]
+
+        screen = np.empty_like(ndc)
+        screen[:, 0] = (ndc[:, 0] + 1) / 2 * self.width
+        screen[:, 1] = (1 - ndc[:, 1]) / 2 * self.height
+        screen[:, 2] = ndc[:, 2]
+        return screen
@@ -3,6 +3,9 @@ import pygame
 from numpy import matrix, cos, sin
 from pygame import Surface
 
+from .camera import Camera
+from ..animation import Quaternion, to_matrix
+
 
 def generate_x(theta):
     return matrix([
@@ -33,38 +36,43 @@ class Cube3D:
         self.position = np.array([x, y, 0])
         self.size = size
         self.angles = np.array([0, 0, 0]) if angles is None else angles
+        self.bounding_radius = size * np.sqrt(3) / 2
+        self.orientation = np.identity(3)
 
     def rotate(self, x_theta, y_theta, z_theta):
         self.angles = np.array([x_theta, y_theta, z_theta])
 
-    def render(self, screen: Surface):
-        # FRONT
-        points = [
-            matrix([-self.size / 2, -self.size / 2, self.size / 2]),  # bottom left
-            matrix([self.size / 2, -self.size / 2, self.size / 2]),  # bottom right
-            matrix([self.size / 2, self.size / 2, self.size / 2]),  # top right
-            matrix([-self.size / 2, self.size / 2, self.size / 2]),  # top left
-        ]
-
-        # BACK
-        points += [
-            matrix([-self.size / 2, -self.size / 2, -self.size / 2]),  # bottom left
-            matrix([self.size / 2, -self.size / 2, -self.size / 2]),  # bottom right
-            matrix([self.size / 2, self.size / 2, -self.size / 2]),  # top right
-            matrix([-self.size / 2, self.size / 2, -self.size / 2]),  # top left
-        ]
-
-        # Rotate the points
-        rotated_points = [
-            generate_x(self.angles[0]) * generate_y(self.angles[1]) * generate_z(self.angles[2]) * point.T
-            for point in points
-        ]
-
-        # Translate the points
-        translated_points = [
-            np.array(point).squeeze() + self.position
-            for point in rotated_points
-        ]
+    def set_orientation(self, orientation: Quaternion):
+        """Orientation applied on top of the rotation angles, e.g. the one of an animated qubit."""
+        self.orientation = np.array(to_matrix(orientation))
+
+    def render(self, screen: Surface, camera: Camera = None):
+        # Skip the whole cube before any per-vertex work if the camera does not see it
+        if camera is not None and not camera.is_visible(self.position, self.bounding_radius):
+            return
+
+        points = np.array([
+            # FRONT
+            [-self.size / 2, -self.size / 2, self.size / 2],  # bottom left
+            [self.size / 2, -self.size / 2, self.size / 2],  # bottom right
+            [self.size / 2, self.size / 2, self.size / 2],  # top right
+            [-self.size / 2, self.size / 2, self.size / 2],  # top left
+            # BACK
+            [-self.size / 2, -self.size / 2, -self.size / 2],  # bottom left
+            [self.size / 2, -self.size / 2, -self.size / 2],  # bottom right
+            [self.size / 2, self.size / 2, -self.size / 2],  # top right
+            [-self.size / 2, self.size / 2, -self.size / 2],  # top left
+        ])
+
+        # Rotate and translate all the points at once
+        rotation = self.orientation * generate_x(self.angles[0]) * generate_y(self.angles[1]) * generate_z(
+            self.angles[2])
+        world_points = np.asarray(points @ rotation.T) + self.position
+
+        # Without a camera the projection is orthographic
+        if camera is not None:
+            world_points = camera.project(world_points)
+        translated_points = list(world_points)
 
         # Draw the points
         for point in translated_points:
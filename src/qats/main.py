@@ -1,6 +1,8 @@
 import numpy as np
 import pygame
 
+from .animation import IDENTITY, KEYFRAMES, STATE_VECTORS, Animator, multiply
+from .components.camera import Camera
 from .components.cube import Cube3D
 
 
@@ -10,19 +12,39 @@ def main_loop():
     clock = pygame.time.Clock()
     running = True
 
+    camera = Camera(1280, 720)
     cube = Cube3D(640, 360, 100)
     dt = 0
 
+    # Keys 1 to 6 turn the cube towards one of the states
+    animator = Animator()
+    states = list(STATE_VECTORS)
+    state = states[0]
+    base = target = IDENTITY
+
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and pygame.K_1 <= event.key < pygame.K_1 + len(states):
+                new_state = states[event.key - pygame.K_1]
+                if new_state == state:
+                    # Already there or moving there, the running animation goes on
+                    continue
+                # An unfinished animation is cancelled, the new one starts from its end
+                base = target
+                target = multiply(KEYFRAMES[state, new_state][-1], base)
+                animator.start("cube", state, new_state)
+                state = new_state
+
+        for frame in animator.tick().values():
+            cube.set_orientation(multiply(frame.rotation, base))
 
         screen.fill((255, 255, 255))
 
         cube.rotate(dt * 2, dt, 0)
 
-        cube.render(screen)
+        cube.render(screen, camera)
 
         pygame.display.flip()
 